@@ -1,6 +1,5 @@
 # Exposes the '/generate' endpoint
 
-import json
 from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter
@@ -13,6 +12,7 @@ from pydantic import (
     Field,
     TypeAdapter,
 )
+from pydantic_core import to_json
 
 from core.dependencies import qa_engine
 from core.qa_engine import (
@@ -143,11 +143,13 @@ async def generate(request: GenerateRequest):
                             description=chunk.item.description,
                         )
 
-                yield f"{response.model_dump_json()}\n"
+                # Serialize straight to UTF-8 bytes; StreamingResponse sends
+                # bytes chunks without re-encoding them
+                yield to_json(response) + b"\n"
         except Exception as e:
             # Send error as final chunk
             error_response = {"type": "error", "message": str(e)}
-            yield f"{json.dumps(error_response)}\n"
+            yield to_json(error_response) + b"\n"
             raise
 
     return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -6,7 +6,7 @@ constitution and reality data.
 """
 
 from dataclasses import asdict
-from functools import cache
+from functools import cache, lru_cache
 
 from jinja2 import Environment, FileSystemLoader, Template
 
@@ -23,10 +23,16 @@ def _load_template(file: str) -> Template:
     ).get_template(file)
 
 
+@lru_cache(maxsize=1)
 def _format_constitution(axiom_store: AxiomStore) -> str:
     """
     Load the constitution template and format it with axiom data.
 
+    An AxiomStore exposes no way to change its axioms after construction,
+    so the constitution is rendered once and reused for every question
+    against the same store. Only the most recent store is kept, so stores
+    that are no longer used can be garbage collected.
+
     Args:
         axiom_store: Storage for axioms/constitution data.
 
@@ -18,6 +18,9 @@ from core.axiom_store import Axiom, AxiomId, AxiomStore
 from core.prompt import build_user_prompt
 from core.reality import RealityId, RealityStatement
 
+# Complete [A-XXX] axiom or [R-XXX] reality citation, compiled once
+_CITATION_PATTERN = re.compile(r"\[(A-\d+|R-\d+)\]")
+
 # Type-safe session identifier for per-user thread isolation
 UserSessionId = NewType("UserSessionId", str)
 
@@ -142,18 +145,21 @@ class QAEngine:
             AsyncIterator of TextContent or citation candidate instances
         """
 
-        def _is_complete_or_no_citation(buffer: str) -> bool:
-            return ("[" not in buffer) or ("]" in buffer)
-
         buffer = ""
 
         async for chunk in chunks:
             buffer += chunk
 
-            # Check for both AXIOM and REALITY citations
-            while match := re.search(r"\[(A-\d+|R-\d+)\]", buffer):
-                # Yield text before the citation
-                yield TextContent(content=buffer[: match.start()])
+            # Scan the buffer once for complete AXIOM and REALITY citations;
+            # search() from a cursor avoids creating a finditer scanner for
+            # the many small chunks without a citation
+            position = 0
+            while (
+                match := _CITATION_PATTERN.search(buffer, position)
+            ) is not None:
+                # Yield text before the citation, if any
+                if match.start() > position:
+                    yield TextContent(content=buffer[position : match.start()])
 
                 # Determine citation type and create appropriate ID
                 citation_id = match.group(1)
@@ -168,12 +174,17 @@ class QAEngine:
                         text=match.group(0),
                     )
 
-                buffer = buffer[match.end() :]
+                position = match.end()
 
-            # Yield buffer if it doesn't contain an incomplete citation
-            if buffer and _is_complete_or_no_citation(buffer):
-                yield TextContent(content=buffer)
-                buffer = ""
+            # Hold back a trailing unclosed "[" that may start a citation
+            # completed by the next chunk; yield everything before it
+            open_index = buffer.rfind("[", position)
+            if open_index != -1 and "]" in buffer[open_index:]:
+                open_index = -1
+            end = open_index if open_index != -1 else len(buffer)
+            if end > position:
+                yield TextContent(content=buffer[position:end])
+            buffer = buffer[end:]
 
         # Yield remaining buffer
         if buffer:
@@ -198,12 +209,12 @@ class QAEngine:
             The AI response text.
         """
         # Collect all chunks from the streaming response
-        result = ""
+        parts: list[str] = []
         stream = self.invoke_streaming(question, session_id, reality)
         async for chunk in stream:
-            result += chunk.content
+            parts.append(chunk.content)
 
-        return result
+        return "".join(parts)
 
     async def invoke_streaming(
         self,
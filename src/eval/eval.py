@@ -1,6 +1,7 @@
 import asyncio
 import json
 import re
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Protocol
@@ -8,23 +9,16 @@ from typing import Protocol
 from core.paths import root
 from eval.dependencies import qa_eval_engine
 from eval.models import (
-    AccuracyMetric,
     AxiomItem,
-    AxiomPrecisionMetric,
-    AxiomRecallMetric,
-    AxiomReferenceResults,
     AxiomReferences,
-    CoverageMetric,
-    EvaluationResult,
     EvaluationSampleInput,
     EvaluationSampleOutput,
     RealityItem,
-    RealityPrecisionMetric,
-    RealityRecallMetric,
-    RealityReferenceResults,
     RealityReferences,
+    ReferenceResults,
 )
 from eval.report_generation.report import Report
+from eval.stats import calculate_stats
 
 AXIOM_REFERENCE_PATTERN = r"\[A-\d+\]"
 REALITY_REFERENCE_PATTERN = r"\[R-\d+\]"
@@ -94,35 +88,6 @@ def load_reality_definitions(
     return [RealityItem.model_validate(item) for item in data]
 
 
-def calculate_mean_std(scores: list[float]) -> tuple[float, float]:
-    """Calculate mean and standard deviation for a list of scores.
-
-    Args:
-        scores: List of numeric scores to analyze.
-
-    Returns:
-        Tuple of (mean, standard_deviation).
-        Returns (0.0, 0.0) for empty lists.
-        Standard deviation is 0.0 for single-element lists.
-
-    Examples:
-        >>> calculate_mean_std([1.0, 2.0, 3.0])
-        (2.0, 0.816496580927726)
-        >>> calculate_mean_std([5.0])
-        (5.0, 0.0)
-        >>> calculate_mean_std([])
-        (0.0, 0.0)
-    """
-    if not scores:
-        return 0.0, 0.0
-
-    mean = sum(scores) / len(scores)
-    variance = sum((score - mean) ** 2 for score in scores) / len(scores)
-    std = variance**0.5 if len(scores) > 1 else 0.0
-
-    return mean, std
-
-
 def calculate_precision_recall(
     found: list[str], expected: list[str]
 ) -> tuple[float, float]:
@@ -165,7 +130,7 @@ def calculate_precision_recall(
 
 def evaluate_axiom_references(
     real_axioms: AxiomReferences, expected_axioms: AxiomReferences
-) -> AxiomReferenceResults:
+) -> ReferenceResults:
     """Evaluate axiom references found vs expected.
 
     Extracts and normalizes axiom references from the LLM answer,
@@ -179,7 +144,7 @@ def evaluate_axiom_references(
             (e.g., ["A-001", "A-002"]).
 
     Returns:
-        AxiomReferenceResults containing the normalized found references,
+        ReferenceResults containing the normalized found references,
         expected references, and precision/recall scores.
 
     Examples:
@@ -197,7 +162,7 @@ def evaluate_axiom_references(
     precision, recall = calculate_precision_recall(
         normalized_found, expected_axioms
     )
-    return AxiomReferenceResults(
+    return ReferenceResults(
         references_found=normalized_found,
         references_expected=expected_axioms,
         precision=precision,
@@ -207,7 +172,7 @@ def evaluate_axiom_references(
 
 def evaluate_reality_references(
     real_reality: RealityReferences, expected_reality: RealityReferences
-) -> RealityReferenceResults:
+) -> ReferenceResults:
     """Evaluate reality references found vs expected.
 
     Extracts and normalizes reality references from the LLM answer,
@@ -221,7 +186,7 @@ def evaluate_reality_references(
             (e.g., ["R-001", "R-002"]).
 
     Returns:
-        RealityReferenceResults containing the normalized found references,
+        ReferenceResults containing the normalized found references,
         expected references, and precision/recall scores.
 
     Examples:
@@ -239,7 +204,7 @@ def evaluate_reality_references(
     precision, recall = calculate_precision_recall(
         normalized_found, expected_reality
     )
-    return RealityReferenceResults(
+    return ReferenceResults(
         references_found=normalized_found,
         references_expected=expected_reality,
         precision=precision,
@@ -334,107 +299,12 @@ async def evaluate_answer(
     )
 
 
-def calculate_stats(
-    evaluation_results: list[EvaluationSampleOutput],
-    axiom_definitions: list[AxiomItem] | None = None,
-    reality_definitions: list[RealityItem] | None = None,
-) -> EvaluationResult:
-    """
-    Calculate statistical metrics from evaluation results.
-
-    Args:
-        evaluation_results: Collection of evaluation outputs to analyze
-        axiom_definitions: Optional list of axiom items to include in results
-        reality_definitions: Optional list of reality items to include in
-            results
-
-    Returns:
-        EvaluationResult: Object containing the evaluation outputs and computed
-        statistical metrics including accuracy and topic coverage.
-    """
-    if not evaluation_results:
-        return EvaluationResult(
-            evaluation_outputs=[],
-            accuracy=AccuracyMetric(mean=0.0, std=0.0),
-            topic_coverage=CoverageMetric(mean=0.0, std=0.0),
-            axiom_precision_metric=AxiomPrecisionMetric(mean=0.0, std=0.0),
-            axiom_recall_metric=AxiomRecallMetric(mean=0.0, std=0.0),
-            reality_precision_metric=RealityPrecisionMetric(mean=0.0, std=0.0),
-            reality_recall_metric=RealityRecallMetric(mean=0.0, std=0.0),
-            axiom_definitions=axiom_definitions,
-            reality_definitions=reality_definitions,
-        )
-
-    # Calculate accuracy statistics
-    accuracy_scores = [
-        result.accuracy.accuracy_mean for result in evaluation_results
-    ]
-    accuracy_mean, accuracy_std = calculate_mean_std(accuracy_scores)
-
-    # Calculate topic coverage statistics
-    coverage_scores = [
-        result.topic_coverage.coverage_score for result in evaluation_results
-    ]
-    coverage_mean, coverage_std = calculate_mean_std(coverage_scores)
-
-    # Calculate axiom precision statistics
-    axiom_precision_scores = [
-        result.axiom_references.precision for result in evaluation_results
-    ]
-    axiom_precision_mean, axiom_precision_std = calculate_mean_std(
-        axiom_precision_scores
-    )
-
-    # Calculate axiom recall statistics
-    axiom_recall_scores = [
-        result.axiom_references.recall for result in evaluation_results
-    ]
-    axiom_recall_mean, axiom_recall_std = calculate_mean_std(
-        axiom_recall_scores
-    )
-
-    # Calculate reality precision statistics
-    reality_precision_scores = [
-        result.reality_references.precision for result in evaluation_results
-    ]
-    reality_precision_mean, reality_precision_std = calculate_mean_std(
-        reality_precision_scores
-    )
-
-    # Calculate reality recall statistics
-    reality_recall_scores = [
-        result.reality_references.recall for result in evaluation_results
-    ]
-    reality_recall_mean, reality_recall_std = calculate_mean_std(
-        reality_recall_scores
-    )
-
-    return EvaluationResult(
-        evaluation_outputs=evaluation_results,
-        accuracy=AccuracyMetric(mean=accuracy_mean, std=accuracy_std),
-        topic_coverage=CoverageMetric(mean=coverage_mean, std=coverage_std),
-        axiom_precision_metric=AxiomPrecisionMetric(
-            mean=axiom_precision_mean, std=axiom_precision_std
-        ),
-        axiom_recall_metric=AxiomRecallMetric(
-            mean=axiom_recall_mean, std=axiom_recall_std
-        ),
-        reality_precision_metric=RealityPrecisionMetric(
-            mean=reality_precision_mean, std=reality_precision_std
-        ),
-        reality_recall_metric=RealityRecallMetric(
-            mean=reality_recall_mean, std=reality_recall_std
-        ),
-        axiom_definitions=axiom_definitions,
-        reality_definitions=reality_definitions,
-    )
-
-
 async def run_evaluation(
     *,
     question_answer_fn: QuestionAnswerFunction,
     input_data_path: Path | None = None,
     output_data_path: Path | None = None,
+    max_concurrency: int | None = None,
 ) -> None:
     """Run the full evaluation pipeline.
 
@@ -448,6 +318,12 @@ async def run_evaluation(
             samples. Defaults to 'data/eval_dataset.json'.
         output_data_path: Path to the output directory for results.
             Defaults to 'runs/{timestamp}'.
+        max_concurrency: Maximum number of samples answered and evaluated
+            at the same time. Bounds the request rate against the model
+            deployment quota. Must be positive; defaults to no limit.
+
+    Raises:
+        ValueError: If max_concurrency is not a positive integer.
 
     Side Effects:
         - Creates output directory if it doesn't exist.
@@ -456,6 +332,9 @@ async def run_evaluation(
         - Generates an HTML report in the output directory.
     """
 
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+
     input_path = input_data_path or root() / "data/eval_dataset.json"
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = output_data_path or root() / f"runs/{timestamp}"
@@ -468,15 +347,22 @@ async def run_evaluation(
     axiom_definitions = load_axiom_definitions()
     reality_definitions = load_reality_definitions()
 
+    limiter: AbstractAsyncContextManager[object] = (
+        asyncio.Semaphore(max_concurrency)
+        if max_concurrency is not None
+        else nullcontext()
+    )
+
     async def process_sample(sample_data: str) -> EvaluationSampleOutput:
         parsed_input = EvaluationSampleInput.model_validate(sample_data)
 
-        llm_response = await question_answer_fn(query=parsed_input.query)
+        async with limiter:
+            llm_response = await question_answer_fn(query=parsed_input.query)
 
-        _ = (output_path / f"results_{parsed_input.id}.md").write_text(
-            llm_response
-        )
-        return await evaluate_answer(parsed_input, llm_response)
+            _ = (output_path / f"results_{parsed_input.id}.md").write_text(
+                llm_response
+            )
+            return await evaluate_answer(parsed_input, llm_response)
 
     evaluation_results = await asyncio.gather(
         *map(process_sample, json.loads(input_path.read_text()))
@@ -4,6 +4,20 @@ import asyncio
 from eval.eval import QuestionAnswerFunction, run_evaluation
 
 
+def positive_int(value: str) -> int:
+    """Parse a command line value as a positive integer."""
+    error = argparse.ArgumentTypeError(
+        f"must be a positive integer, got {value!r}"
+    )
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise error from e
+    if number < 1:
+        raise error
+    return number
+
+
 def run_evaluation_with_qa_function(
     question_answer_fn: QuestionAnswerFunction,
 ):
@@ -26,6 +40,16 @@ def run_evaluation_with_qa_function(
         ),
     )
 
+    _ = parser.add_argument(
+        "--max_concurrency",
+        type=positive_int,
+        required=False,
+        help=(
+            "Maximum number of samples evaluated concurrently "
+            "(optional, defaults to no limit)"
+        ),
+    )
+
     args = parser.parse_args()
 
     # Run the async evaluation function
@@ -33,6 +57,7 @@ def run_evaluation_with_qa_function(
         run_evaluation(
             question_answer_fn=question_answer_fn,
             input_data_path=args.data_path,
+            max_concurrency=args.max_concurrency,
         )
     )
 
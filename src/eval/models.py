@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 AxiomReferences = list[str]
 RealityReferences = list[str]
@@ -65,6 +66,8 @@ class Entity(BaseModel):
     Example: High credit utilization significantly increases default risk.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     trigger_variable: str = Field(
         description=(
             "The name of the variable, related with habits, activities, ..."
@@ -99,6 +102,8 @@ class EntityAccuracy(BaseModel):
     Represents the accuracy evaluation for a specific entity.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     entity: Entity = Field(
         description="The entity being evaluated for accuracy."
     )
@@ -134,9 +139,12 @@ class AccuracyEvaluationResults(BaseModel):
         """
         if not self.entity_accuracies:
             return 0.0
-        return sum(entity.score for entity in self.entity_accuracies) / len(
-            self.entity_accuracies
+        scores = np.fromiter(
+            (entity.score for entity in self.entity_accuracies),
+            dtype=np.float64,
+            count=len(self.entity_accuracies),
         )
+        return float(scores.mean())
 
 
 class TopicCoverageEvaluationResults(BaseModel):
@@ -168,12 +176,15 @@ class TopicCoverageEvaluationResults(BaseModel):
 
 class ReferenceResults(BaseModel):
     """
-    Base model for storing reference evaluation results.
+    Model for storing reference evaluation results.
 
-    This class provides the common structure for evaluating references (axioms
-    or reality facts) cited in LLM responses against expected references.
+    This class holds the evaluation of references (axioms or reality facts)
+    cited in LLM responses against expected references. The same model is
+    used for both kinds; the owning field name tells them apart.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     references_found: list[str] = Field(
         description="List of references found in the LLM answer."
     )
@@ -192,98 +203,25 @@ class ReferenceResults(BaseModel):
     )
 
 
-class AxiomReferenceResults(ReferenceResults):
-    """
-    A model for storing axiom reference evaluation results.
-    """
-
-    pass
-
-
-class RealityReferenceResults(ReferenceResults):
-    """
-    A model for storing reality reference evaluation results.
-    """
-
-    pass
-
-
 class Metric(BaseModel):
     """
     A data model representing statistical metrics with mean and standard
     deviation.
 
+    A single model is shared by every aggregated metric (accuracy, coverage,
+    reference precision/recall); the owning field name identifies the metric.
+
     Attributes:
         mean (float): The arithmetic mean of the data. std (float): The
         standard deviation of the data.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     mean: float
     std: float
 
 
-class AccuracyMetric(Metric):
-    """
-    A metric class for calculating accuracy of predictions.
-
-    This metric computes the accuracy as the fraction of predictions that match
-    the true labels. Accuracy is calculated as the number of correct
-    predictions divided by the total number of predictions.
-
-    The metric can be used for classification tasks where exact matches between
-    predicted and actual values are required.
-
-    Returns:
-        float: Accuracy score between 0.0 and 1.0, where 1.0 represents perfect
-        accuracy.
-    """
-
-
-class CoverageMetric(Metric):
-    """
-    A metric class for measuring topic coverage during evaluation.
-
-    This metric tracks the degree to which responses cover expected topics or
-    concepts in the evaluation samples. It provides insights into how
-    comprehensively the system addresses the relevant subject matter.
-
-    Attributes:
-        Inherits all attributes from the base Metric class.
-
-    Methods:
-        Inherits all methods from the base Metric class and may override
-        specific methods to implement coverage-specific calculations.
-
-    Usage:
-        Used to monitor and report topic coverage statistics during evaluation
-        workflows.
-    """
-
-
-class AxiomPrecisionMetric(Metric):
-    """
-    A metric class for measuring axiom reference precision during evaluation.
-    """
-
-
-class AxiomRecallMetric(Metric):
-    """
-    A metric class for measuring axiom reference recall during evaluation.
-    """
-
-
-class RealityPrecisionMetric(Metric):
-    """
-    A metric class for measuring reality reference precision during evaluation.
-    """
-
-
-class RealityRecallMetric(Metric):
-    """
-    A metric class for measuring reality reference recall during evaluation.
-    """
-
-
 class EvaluationSampleInput(BaseModel):
     """
     A data model representing input data for evaluation samples.
@@ -341,8 +279,8 @@ class EvaluationSampleOutput(BaseModel):
     entities: EntityExtraction
     accuracy: AccuracyEvaluationResults
     topic_coverage: TopicCoverageEvaluationResults
-    axiom_references: AxiomReferenceResults
-    reality_references: RealityReferenceResults
+    axiom_references: ReferenceResults
+    reality_references: ReferenceResults
 
 
 class EvaluationResult(BaseModel):
@@ -357,20 +295,20 @@ class EvaluationResult(BaseModel):
         evaluation_outputs (list[EvaluationSampleOutput]): A list of
             individual sample evaluation results, containing the detailed
             outputs for each test case.
-        accuracy (AccuracyMetric): Metric measuring the correctness of
+        accuracy (Metric): Metric measuring the correctness of
             predictions or responses across the evaluation dataset.
-        topic_coverage (CoverageMetric): Metric measuring how well the
+        topic_coverage (Metric): Metric measuring how well the
             evaluation spans different topics or categories in the domain.
-        axiom_precision_metric (AxiomPrecisionMetric): Metric measuring
+        axiom_precision_metric (Metric): Metric measuring
             the precision of axiom references (ratio of correct axiom
             references to total axiom references found).
-        axiom_recall_metric (AxiomRecallMetric): Metric measuring the
+        axiom_recall_metric (Metric): Metric measuring the
             recall of axiom references (ratio of found axiom references to
             expected axiom references).
-        reality_precision_metric (RealityPrecisionMetric): Metric measuring
+        reality_precision_metric (Metric): Metric measuring
             the precision of reality references (ratio of correct reality
             references to total reality references found).
-        reality_recall_metric (RealityRecallMetric): Metric measuring the
+        reality_recall_metric (Metric): Metric measuring the
             recall of reality references (ratio of found reality references to
             expected reality references).
         axiom_definitions (list[AxiomItem] | None): Optional list of all
@@ -382,12 +320,12 @@ class EvaluationResult(BaseModel):
     """
 
     evaluation_outputs: list[EvaluationSampleOutput]
-    accuracy: AccuracyMetric
-    topic_coverage: CoverageMetric
-    axiom_precision_metric: AxiomPrecisionMetric
-    axiom_recall_metric: AxiomRecallMetric
-    reality_precision_metric: RealityPrecisionMetric
-    reality_recall_metric: RealityRecallMetric
+    accuracy: Metric
+    topic_coverage: Metric
+    axiom_precision_metric: Metric
+    axiom_recall_metric: Metric
+    reality_precision_metric: Metric
+    reality_recall_metric: Metric
     axiom_definitions: list[AxiomItem] | None = Field(
         default=None,
         description=(
@@ -402,3 +340,10 @@ class EvaluationResult(BaseModel):
             "descriptions. Used for displaying reality content in reports."
         ),
     )
+
+
+# Shared adapter for validating and dumping whole evaluation results
+# (validate_python/validate_json/dump_json). It runs the same validator as
+# EvaluationResult.model_validate; it is a single entry point, not a faster
+# one.
+EVAL_ADAPTER: TypeAdapter[EvaluationResult] = TypeAdapter(EvaluationResult)
@@ -0,0 +1,185 @@
+"""Display values precomputed for the report front end.
+
+script.js renders every evaluation from evaluation_data.json. Values that
+only depend on the evaluation data (score classes, formatted percentages,
+highlighted answer texts) are computed here once at report generation time
+and shipped under a separate top-level key, so the browser substitutes
+ready-made strings instead of recomputing them per render.
+"""
+
+from collections.abc import Mapping
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from eval.report_generation.highlight import (
+    entity_values,
+    find_entities_in_text,
+    highlight_entities_in_text,
+)
+
+# Drive the score badge classes script.js reads from evaluation_display
+SCORE_GOOD_THRESHOLD = 0.7
+SCORE_MEDIUM_THRESHOLD = 0.4
+
+
+def score_class(score: float) -> str:
+    """Return the CSS class used to color-code a score between 0 and 1."""
+    if score >= SCORE_GOOD_THRESHOLD:
+        return "score-good"
+    if score >= SCORE_MEDIUM_THRESHOLD:
+        return "score-medium"
+    return "score-poor"
+
+
+def format_percent(score: float) -> str:
+    """Format a score between 0 and 1 as a whole percentage.
+
+    Rounds half up on the exact binary value, matching JavaScript's
+    (score * 100).toFixed(0) so precomputed and client-side badges agree.
+    """
+    percent = Decimal(score * 100).quantize(Decimal(1), ROUND_HALF_UP)
+    return f"{percent}%"
+
+
+def format_score(score: float) -> str:
+    """Format a score between 0 and 1 with two decimals.
+
+    Rounds half up on the exact binary value, like score.toFixed(2).
+    """
+    return str(Decimal(score).quantize(Decimal("0.01"), ROUND_HALF_UP))
+
+
+def build_summary(
+    evaluation_data: dict[str, Any], schema_invalid_count: int = 0
+) -> dict[str, str]:
+    """Precompute the formatted summary statistics card values.
+
+    The overall score is the unweighted average of the six aggregated
+    metrics: accuracy, topic coverage and axiom/reality precision/recall.
+
+    Args:
+        evaluation_data: Dumped EvaluationResult dictionary
+        schema_invalid_count: Number of schema-invalid evaluation outputs
+            left out of the report
+
+    Returns:
+        Display text keyed by summary statistic, as shown in index.html.
+    """
+    metrics = {
+        "avg_accuracy": evaluation_data["accuracy"]["mean"],
+        "avg_coverage": evaluation_data["topic_coverage"]["mean"],
+        "avg_axiom_precision": evaluation_data["axiom_precision_metric"][
+            "mean"
+        ],
+        "avg_axiom_recall": evaluation_data["axiom_recall_metric"]["mean"],
+        "avg_reality_precision": evaluation_data["reality_precision_metric"][
+            "mean"
+        ],
+        "avg_reality_recall": evaluation_data["reality_recall_metric"]["mean"],
+    }
+    overall_score = sum(metrics.values()) / len(metrics)
+    return {
+        "total_evaluations": str(len(evaluation_data["evaluation_outputs"])),
+        **{name: format_score(value) for name, value in metrics.items()},
+        "overall_score": format_score(overall_score),
+        "schema_invalid_samples": str(schema_invalid_count),
+    }
+
+
+def _reference_display(references: dict[str, Any]) -> dict[str, str]:
+    """Return badge classes and percentages for reference precision/recall."""
+    precision = references["precision"]
+    recall = references["recall"]
+    return {
+        "precision_class": score_class(precision),
+        "precision_pct": format_percent(precision),
+        "recall_class": score_class(recall),
+        "recall_pct": format_percent(recall),
+    }
+
+
+def _definitions_map(
+    definitions: list[dict[str, Any]] | None,
+) -> dict[str, str]:
+    """Map definition IDs to descriptions, skipping incomplete items."""
+    return {
+        item["id"]: item["description"]
+        for item in definitions or []
+        if item["id"] and item["description"]
+    }
+
+
+def build_evaluation_display(
+    evaluation_data: dict[str, Any],
+    entity_colors: Mapping[str, int],
+) -> list[dict[str, Any]]:
+    """Precompute display values for each evaluation output.
+
+    Every score badge gets its class and formatted percentage (accuracy,
+    coverage, reference precision/recall and per-entity accuracy). The
+    expected answer and LLM response are highlighted: entities that occur
+    in both texts are wrapped in colored spans and axiom/reality references
+    get tooltips.
+
+    Args:
+        evaluation_data: Dumped EvaluationResult dictionary
+        entity_colors: Color index per entity, from assign_entity_colors
+
+    Returns:
+        One entry per evaluation output, in the same order.
+    """
+    evaluation_outputs = evaluation_data["evaluation_outputs"]
+    axiom_definitions = _definitions_map(evaluation_data["axiom_definitions"])
+    reality_definitions = _definitions_map(
+        evaluation_data["reality_definitions"]
+    )
+
+    display: list[dict[str, Any]] = []
+    for evaluation in evaluation_outputs:
+        accuracy = evaluation["accuracy"]["accuracy_mean"]
+        coverage = evaluation["topic_coverage"]["coverage_score"]
+        expected_answer = evaluation["input"]["expected_answer"]
+        llm_response = evaluation["llm_response"]
+
+        # Only highlight entities that appear in BOTH texts
+        entities = entity_values(evaluation["entities"].values())
+        in_llm = set(find_entities_in_text(llm_response, entities))
+        common_entities = [
+            entity
+            for entity in find_entities_in_text(expected_answer, entities)
+            if entity in in_llm
+        ]
+
+        display.append(
+            {
+                "accuracy_class": score_class(accuracy),
+                "accuracy_pct": format_percent(accuracy),
+                "coverage_class": score_class(coverage),
+                "coverage_pct": format_percent(coverage),
+                "axiom_references": _reference_display(
+                    evaluation["axiom_references"]
+                ),
+                "reality_references": _reference_display(
+                    evaluation["reality_references"]
+                ),
+                "entity_score_pcts": [
+                    format_percent(result["score"])
+                    for result in evaluation["accuracy"]["entity_accuracies"]
+                ],
+                "highlighted_expected": highlight_entities_in_text(
+                    expected_answer,
+                    common_entities,
+                    entity_colors,
+                    axiom_definitions,
+                    reality_definitions,
+                ),
+                "highlighted_llm": highlight_entities_in_text(
+                    llm_response,
+                    common_entities,
+                    entity_colors,
+                    axiom_definitions,
+                    reality_definitions,
+                ),
+            }
+        )
+    return display
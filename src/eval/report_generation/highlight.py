@@ -0,0 +1,224 @@
+"""Entity and reference highlighting for the report's answer texts.
+
+The expected answer and LLM response of each evaluation are highlighted once
+at report generation time instead of on every render in the browser.
+Entities found in both texts are wrapped in colored spans, [A-001]/[R-001]
+references get tooltip spans and line breaks/markdown bold are converted.
+The texts themselves are HTML-escaped, like every untrusted string that
+script.js inserts.
+
+Regexes follow JavaScript semantics where they differ from Python's
+defaults: word boundaries and digits are ASCII-only.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any
+
+# Number of .entity-color-N classes defined in styles.css
+ENTITY_COLOR_COUNT = 20
+
+_HTML_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#039;",
+    }
+)
+
+# Limit the numeric part to 1-4 digits to avoid matching excessively long IDs
+_REFERENCE_PATTERN = re.compile(r"\[(A-[0-9]{1,4}|R-[0-9]{1,4})\]")
+_LINE_BREAK_PATTERN = re.compile(r"\r\n?|\n")
+_BOLD_PATTERN = re.compile(r"\*\*([^\r\n\u2028\u2029]*?)\*\*")
+
+# ASCII-only \b, like a JavaScript regex without the u flag
+_WORD_BOUNDARY = r"(?a:\b)"
+
+
+def escape_html(text: str) -> str:
+    """Escape HTML special characters, like escapeHtml() in script.js."""
+    return text.translate(_HTML_ESCAPES)
+
+
+def convert_line_breaks(text: str) -> str:
+    """Convert line breaks to <br> tags and markdown bold to <b> tags."""
+    text = _LINE_BREAK_PATTERN.sub("<br>", text)
+    return _BOLD_PATTERN.sub(r"<b>\1</b>", text)
+
+
+def entity_values(entity_groups: Iterable[list[dict[str, Any]]]) -> list[str]:
+    """Return unique, non-empty entity variables in first-seen order.
+
+    Args:
+        entity_groups: Lists of dumped Entity dictionaries
+
+    Returns:
+        Trigger and consequence variables, deduplicated.
+    """
+    values: dict[str, None] = {}
+    for group in entity_groups:
+        for entity in group:
+            for value in (
+                entity["trigger_variable"],
+                entity["consequence_variable"],
+            ):
+                if value:
+                    values[value] = None
+    return list(values)
+
+
+def assign_entity_colors(
+    evaluation_outputs: list[dict[str, Any]],
+) -> dict[str, int]:
+    """Assign a color index to every entity in the evaluation outputs.
+
+    Entities are sorted (by UTF-16 code units, like Array.prototype.sort)
+    and colors are assigned sequentially, cycling through the palette, so
+    the same entity has the same color in every evaluation.
+    """
+    entities = {
+        value: None
+        for evaluation in evaluation_outputs
+        for value in entity_values(evaluation["entities"].values())
+    }
+    ordered = sorted(entities, key=lambda value: value.encode("utf-16-be"))
+    return {
+        entity: index % ENTITY_COLOR_COUNT
+        for index, entity in enumerate(ordered)
+    }
+
+
+@lru_cache(maxsize=256)
+def _entity_pattern(entity: str) -> re.Pattern[str]:
+    """Return the compiled case-insensitive whole-word pattern for entity.
+
+    Entities come from model output, so the cache is bounded; it only needs
+    to hold the entities of the evaluations currently being rendered.
+    """
+    return re.compile(
+        _WORD_BOUNDARY + re.escape(entity) + _WORD_BOUNDARY, re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=8)
+def _entity_list_pattern(sorted_entities: tuple[str, ...]) -> re.Pattern[str]:
+    """Return one compiled pattern matching any of the entities.
+
+    Entities must be sorted longest first so the alternation prefers the
+    longest entity. Entity lists are rarely repeated across evaluations, so
+    the cache is small: it lets the expected answer and LLM response of one
+    evaluation, which are highlighted with the same list, share the pattern.
+    """
+    alternatives = "|".join(map(re.escape, sorted_entities))
+    return re.compile(
+        f"{_WORD_BOUNDARY}(?:{alternatives}){_WORD_BOUNDARY}", re.IGNORECASE
+    )
+
+
+def find_entities_in_text(text: str, entities: list[str]) -> list[str]:
+    """Return the entities that occur in text as whole words.
+
+    Matching is case-insensitive. Each entity is searched on its own so an
+    entity contained in a longer one is still found.
+    """
+    if not text:
+        return []
+    return [
+        entity for entity in entities if _entity_pattern(entity).search(text)
+    ]
+
+
+def highlight_references_in_text(
+    text: str,
+    axiom_definitions: Mapping[str, str],
+    reality_definitions: Mapping[str, str],
+) -> str:
+    """Wrap [A-001]/[R-001] references that have a definition in tooltips.
+
+    References without a definition are left unchanged.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        ref_id = match.group(1)
+        is_axiom = ref_id.startswith("A-")
+        definitions = axiom_definitions if is_axiom else reality_definitions
+        description = definitions.get(ref_id)
+        if not description:
+            return match.group(0)
+        tag_class = "inline-axiom-ref" if is_axiom else "inline-reality-ref"
+        return (
+            f'<span class="inline-reference {tag_class}" '
+            f'data-tooltip="{escape_html(description)}" '
+            f'tabindex="0">[{ref_id}]</span>'
+        )
+
+    return _REFERENCE_PATTERN.sub(replace, text)
+
+
+def highlight_entities_in_text(
+    text: str,
+    entities: list[str],
+    entity_colors: Mapping[str, int],
+    axiom_definitions: Mapping[str, str],
+    reality_definitions: Mapping[str, str],
+) -> str:
+    """Highlight entities and references in text and convert line breaks.
+
+    Entities are highlighted first, on the raw text, so entity names are
+    never matched inside the tooltip attributes added for references.
+    Longer entities take precedence over entities they contain. All text
+    outside the generated tags is HTML-escaped.
+
+    Args:
+        text: The text to highlight
+        entities: Entity strings to highlight
+        entity_colors: Color index per entity
+        axiom_definitions: Axiom ID to description
+        reality_definitions: Reality ID to description
+
+    Returns:
+        HTML for the highlighted text.
+    """
+    if not text:
+        return ""
+
+    if entities:
+        # Longest first, so the alternation prefers the longest entity
+        sorted_entities = sorted(entities, key=len, reverse=True)
+
+        # Build each entity's span once; matches are looked up by lowercase
+        entity_spans: dict[str, str] = {}
+        for entity in sorted_entities:
+            key = entity.lower()
+            if key not in entity_spans:
+                color_class = f"entity-color-{entity_colors[entity]}"
+                entity_spans[key] = (
+                    f'<span class="entity-highlight {color_class}">'
+                    f"{escape_html(entity)}</span>"
+                )
+
+        # Match on the raw text and escape the text around each span, so
+        # entities never match inside an escaped character like &amp;
+        pieces: list[str] = []
+        position = 0
+        pattern = _entity_list_pattern(tuple(sorted_entities))
+        for match in pattern.finditer(text):
+            pieces.append(escape_html(text[position : match.start()]))
+            pieces.append(
+                entity_spans.get(
+                    match.group(0).lower(), escape_html(match.group(0))
+                )
+            )
+            position = match.end()
+        pieces.append(escape_html(text[position:]))
+        text = "".join(pieces)
+    else:
+        text = escape_html(text)
+
+    text = highlight_references_in_text(
+        text, axiom_definitions, reality_definitions
+    )
+    return convert_line_breaks(text)
@@ -1,83 +1,269 @@
 """Report generation main script."""
 
 import argparse
+import gzip
 import json
 import logging
-import shutil
+import re
+from dataclasses import dataclass
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic_core import from_json, to_json
 
-from eval.models import EvaluationResult
+from eval.models import (
+    EVAL_ADAPTER,
+    AxiomItem,
+    EvaluationResult,
+    EvaluationSampleOutput,
+    RealityItem,
+)
+from eval.report_generation.display import (
+    build_evaluation_display,
+    build_summary,
+)
+from eval.report_generation.highlight import assign_entity_colors
+from eval.stats import calculate_stats
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_INVALID_FILENAME = "schema_invalid.jsonl"
+
+# Static report assets written (minified) from the templates directory
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+TEMPLATE_FILES = ("styles.css", "script.js", "index.html")
+
+
+def _invalid_structure_error(error: ValidationError) -> ValueError:
+    """Log a schema validation failure and wrap it in a ValueError."""
+    logger.error("JSON data does not match EvaluationResult schema: %s", error)
+    error_msg = (
+        f"Invalid evaluation data structure: "
+        f"{error.error_count()} validation error(s). "
+        f"See logs for details."
+    )
+    return ValueError(error_msg)
+
+
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+@cache
+def _minified_template(source: Path) -> bytes:
+    """Minify a static template once per process and reuse the bytes.
+
+    Only whitespace that doesn't affect the result is removed: indentation,
+    trailing whitespace and blank lines (plus comments in CSS). Line breaks
+    are kept, so JavaScript statement boundaries don't change.
+
+    The minifier is line based and doesn't parse the sources, which is only
+    safe while the templates avoid two cases:
+
+    - CSS comments are stripped by pattern, so a "/*...*/" sequence inside
+      a CSS string or url() value would be removed too.
+    - Every line is trimmed, so the whitespace inside a multi-line
+      JavaScript template literal changes; don't build pre or pre-wrap
+      content from one.
+    """
+    text = source.read_text(encoding="utf-8")
+    if source.suffix == ".css":
+        text = _CSS_COMMENT_PATTERN.sub("", text)
+    lines = (line.strip() for line in text.splitlines())
+    return ("\n".join(line for line in lines if line) + "\n").encode()
+
+
+@cache
+def _compressed_template(source: Path) -> bytes:
+    """Gzip a minified template once per process and reuse the bytes."""
+    return gzip.compress(_minified_template(source), compresslevel=6)
+
+
+@dataclass(frozen=True)
+class _LoadedEvaluationData:
+    """Validated evaluation data and the samples quarantined while loading."""
+
+    evaluation_data: dict[str, Any]
+    schema_invalid_samples: list[dict[str, Any]]
+
+
+class _Definitions(BaseModel):
+    """Definitions kept from a document whose aggregates are recomputed."""
+
+    model_config = ConfigDict(extra="ignore")  # Stale aggregates are dropped
+
+    axiom_definitions: list[AxiomItem] | None = None
+    reality_definitions: list[RealityItem] | None = None
+
+
+def _triage_invalid_samples(
+    data: Any, error: ValidationError
+) -> tuple[EvaluationResult, list[dict[str, Any]]]:
+    """Quarantine schema-invalid evaluation outputs.
+
+    Only reached when whole-document validation fails. Each evaluation
+    output is validated on its own; invalid ones are returned as quarantine
+    records and dropped so the rest of the run can still be reported. The
+    aggregated metrics are recomputed over the remaining outputs so they
+    match what the report shows; the stored aggregates are not validated,
+    since they are replaced anyway.
+
+    Returns:
+        The recomputed result and the quarantined samples.
+
+    Raises:
+        ValueError: If the failure is not caused by individual evaluation
+            outputs, or the definitions are invalid.
+    """
+    match data:
+        case {"evaluation_outputs": [*outputs]}:
+            pass
+        case _:
+            raise _invalid_structure_error(error) from error
+
+    valid_outputs: list[EvaluationSampleOutput] = []
+    invalid_samples: list[dict[str, Any]] = []
+    for index, item in enumerate(outputs):
+        try:
+            valid_outputs.append(EvaluationSampleOutput.model_validate(item))
+        except ValidationError as sample_error:
+            logger.warning(
+                "Evaluation output %d is schema-invalid: %d error(s)",
+                index,
+                sample_error.error_count(),
+            )
+            invalid_samples.append(
+                {
+                    "index": index,
+                    "errors": json.loads(sample_error.json(include_url=False)),
+                    "sample": item,
+                }
+            )
+
+    if not invalid_samples:
+        raise _invalid_structure_error(error) from error
+
+    try:
+        definitions = _Definitions.model_validate(data)
+    except ValidationError as e:
+        raise _invalid_structure_error(e) from e
+
+    result = calculate_stats(
+        valid_outputs,
+        definitions.axiom_definitions,
+        definitions.reality_definitions,
+    )
+    return result, invalid_samples
+
 
 class Report:
     """Handles generation of HTML evaluation reports from JSON data."""
 
-    def __init__(self, data_path: str, output_dir: str | None = None) -> None:
+    def __init__(
+        self,
+        data_path: str,
+        output_dir: str | None = None,
+        compress: bool = False,
+    ) -> None:
         """Initialize the Report instance.
 
         Args:
             data_path: Path to the evaluation data JSON file
             output_dir: Output directory for generated files (optional)
+            compress: Also write gzip-compressed copies of the report files
+                (index.html.gz, script.js.gz, styles.css.gz and
+                evaluation_data.json.gz) for servers that serve precompressed
+                files (optional)
         """
         super().__init__()
         self.data_path = Path(data_path).resolve()
         self.output_dir = Path(output_dir).resolve() if output_dir else None
-        self.evaluation_data: dict[str, Any] = {}
+        self.compress = compress
+
+    @cached_property
+    def _loaded_data(self) -> _LoadedEvaluationData:
+        """Evaluation data loaded from the JSON file on first access.
+
+        Expected JSON structure matching EvaluationResult model output.
+        The file is read and validated once; later accesses return the
+        cached result, together with the samples quarantined while loading.
+
+        Raises:
+            FileNotFoundError: If the JSON file doesn't exist; the read
+                itself reports it, so no separate existence check is made.
+            ValueError: If the file is not valid JSON, is empty, contains no
+                data, or has invalid structure.
+        """
+        # Parse with pydantic-core's Rust JSON parser; it reads UTF-8 bytes
+        # directly, so the whole file is read as bytes in one call.
+        data = from_json(self.data_path.read_bytes())
+        if not data:
+            raise ValueError("Evaluation data cannot be empty")
+
+        # Validate structure against the EvaluationResult schema
+        invalid_samples: list[dict[str, Any]] = []
+        try:
+            validated_model = EVAL_ADAPTER.validate_python(data)
+        except ValidationError as e:
+            validated_model, invalid_samples = _triage_invalid_samples(data, e)
+
+        evaluation_data = validated_model.model_dump()
+        logger.info(
+            "Evaluation data validated: %d evaluation outputs",
+            len(evaluation_data["evaluation_outputs"]),
+        )
+
+        return _LoadedEvaluationData(
+            evaluation_data=evaluation_data,
+            schema_invalid_samples=invalid_samples,
+        )
+
+    @property
+    def evaluation_data(self) -> dict[str, Any]:
+        """Validated evaluation data, loaded from the file on first access.
+
+        Raises:
+            FileNotFoundError: If the JSON file doesn't exist.
+            ValueError: If the file is not valid JSON, is empty, contains no
+                data, or has invalid structure.
+        """
+        return self._loaded_data.evaluation_data
+
+    @property
+    def schema_invalid_samples(self) -> list[dict[str, Any]]:
+        """Evaluation outputs quarantined because they failed validation.
+
+        Loads the evaluation data on first access, like evaluation_data.
+        """
+        return self._loaded_data.schema_invalid_samples
 
     def load_json_data(self) -> dict[str, Any]:
         """Load evaluation data from JSON file.
 
-        Expected JSON structure matching EvaluationResult model output.
+        Kept for callers that load explicitly; equivalent to accessing
+        evaluation_data.
 
         Raises:
-            ValueError: If the JSON file is empty, contains no data,
-                or has invalid structure.
+            ValueError: If the file is not valid JSON, is empty, contains no
+                data, or has invalid structure.
         """
-        with open(self.data_path, encoding="utf-8") as file:
-            data = json.load(file)
-            if not data:
-                raise ValueError("Evaluation data cannot be empty")
-
-            # Validate structure using Pydantic model_validate
-            try:
-                validated_model = EvaluationResult.model_validate(data)
-                self.evaluation_data = validated_model.model_dump()
-
-                logger.info(
-                    "Evaluation data validated: %d evaluation outputs",
-                    len(self.evaluation_data["evaluation_outputs"]),
-                )
-            except ValidationError as e:
-                logger.error(
-                    "JSON data does not match EvaluationResult schema: %s", e
-                )
-                error_msg = (
-                    f"Invalid evaluation data structure: "
-                    f"{e.error_count()} validation error(s). "
-                    f"See logs for details."
-                )
-                raise ValueError(error_msg) from e
-
-            return self.evaluation_data
-
-    def _copy_template_file(
-        self, template_dir: Path, filename: str, output_path: Path
-    ) -> None:
-        """Copy a template file to the output directory.
+        return self.evaluation_data
+
+    def _copy_template_file(self, filename: str, output_path: Path) -> None:
+        """Write a minified template file to the output directory.
 
         Args:
-            template_dir: Directory containing template files
-            filename: Name of the file to copy
+            filename: Name of the file in TEMPLATE_DIR to copy
             output_path: Destination directory
         """
-        source = template_dir / filename
+        source = TEMPLATE_DIR / filename
         destination = output_path / filename
-        _ = shutil.copy2(source, destination)
+        _ = destination.write_bytes(_minified_template(source))
+
+        if self.compress:
+            compressed_path = output_path / f"{filename}.gz"
+            _ = compressed_path.write_bytes(_compressed_template(source))
 
     def generate_report(self) -> None:
         """Generate evaluation report from data.
@@ -88,8 +274,10 @@ class Report:
             PermissionError: If unable to create output directory due to
                 permissions.
         """
-        # Load evaluation data
-        _ = self.load_json_data()
+        # Load evaluation data (validated before any output is written)
+        loaded = self._loaded_data
+        evaluation_data = loaded.evaluation_data
+        schema_invalid_samples = loaded.schema_invalid_samples
 
         # Determine output directory (paths already resolved in __init__)
         if self.output_dir is None:
@@ -106,16 +294,58 @@ class Report:
                 f"Cannot create output directory {output_path}: {e}"
             ) from e
 
-        # Copy template files
-        template_dir = Path(__file__).resolve().parent / "templates"
-        self._copy_template_file(template_dir, "styles.css", output_path)
-        self._copy_template_file(template_dir, "script.js", output_path)
-        self._copy_template_file(template_dir, "index.html", output_path)
+        # Write the minified template files
+        for filename in TEMPLATE_FILES:
+            self._copy_template_file(filename, output_path)
+
+        # Entity colors, summary statistics and display values (score
+        # classes, highlighted texts) are precomputed once here and shipped
+        # next to the evaluation data for script.js.
+        entity_colors = assign_entity_colors(
+            evaluation_data["evaluation_outputs"]
+        )
+        payload = {
+            **evaluation_data,
+            "entity_colors": entity_colors,
+            "summary": build_summary(
+                evaluation_data, len(schema_invalid_samples)
+            ),
+            "evaluation_display": build_evaluation_display(
+                evaluation_data, entity_colors
+            ),
+        }
 
-        # Generate evaluation data JSON file
+        # Serialize the evaluation data once with pydantic-core's Rust
+        # serializer. The file is only read by script.js, so it is compact
+        # and keeps non-ASCII characters as UTF-8. The same bytes are
+        # written with a single write() and reused for the gzip copy.
+        data_bytes = to_json(payload)
         data_file_path = output_path / "evaluation_data.json"
-        with open(data_file_path, "w", encoding="utf-8") as data_file:
-            json.dump(self.evaluation_data, data_file, indent=2)
+        with open(data_file_path, "wb") as data_file:
+            _ = data_file.write(data_bytes)
+
+        if self.compress:
+            with open(
+                output_path / "evaluation_data.json.gz", "wb"
+            ) as gz_file:
+                _ = gz_file.write(gzip.compress(data_bytes, compresslevel=1))
+
+        invalid_file_path = output_path / SCHEMA_INVALID_FILENAME
+        if schema_invalid_samples:
+            with open(
+                invalid_file_path, "w", encoding="utf-8"
+            ) as invalid_file:
+                for sample in schema_invalid_samples:
+                    _ = invalid_file.write(json.dumps(sample) + "\n")
+            logger.warning(
+                "%d schema-invalid evaluation output(s) written to %s",
+                len(schema_invalid_samples),
+                invalid_file_path,
+            )
+        else:
+            # Don't leave the triage file of an earlier run next to a report
+            # that has no schema-invalid samples
+            invalid_file_path.unlink(missing_ok=True)
 
         html_file_path = output_path / "index.html"
         logger.info("Report generation complete!")
@@ -125,14 +355,17 @@ class Report:
 
     @classmethod
     def create_and_generate(
-        cls, data_path: str, output_dir: str | None = None
+        cls,
+        data_path: str,
+        output_dir: str | None = None,
+        compress: bool = False,
     ):
         """Create a Report instance and generate the report.
 
         This is a convenience class method that creates an instance and
         immediately generates the report.
         """
-        report = cls(data_path, output_dir)
+        report = cls(data_path, output_dir, compress)
         report.generate_report()
 
 
@@ -157,8 +390,17 @@ def main():
         ),
     )
 
+    _ = parser.add_argument(
+        "--compress",
+        action="store_true",
+        help=(
+            "Also write gzip-compressed copies (.gz) of the report "
+            "files alongside them"
+        ),
+    )
+
     args = parser.parse_args()
-    Report.create_and_generate(args.data_path, args.output_dir)
+    Report.create_and_generate(args.data_path, args.output_dir, args.compress)
 
 
 if __name__ == "__main__":
@@ -62,6 +62,27 @@
  * @property {ReferenceResults} [reality_references] - Reality reference results (optional)
  */
 
+/**
+ * @typedef {Object} ReferenceDisplay
+ * @property {string} precision_class - Score class for the precision
+ * @property {string} precision_pct - Formatted precision percentage (e.g., "75%")
+ * @property {string} recall_class - Score class for the recall
+ * @property {string} recall_pct - Formatted recall percentage (e.g., "75%")
+ */
+
+/**
+ * @typedef {Object} EvaluationDisplay
+ * @property {string} accuracy_class - Score class for the accuracy mean
+ * @property {string} accuracy_pct - Formatted accuracy percentage (e.g., "75%")
+ * @property {string} coverage_class - Score class for the coverage score
+ * @property {string} coverage_pct - Formatted coverage percentage (e.g., "75%")
+ * @property {ReferenceDisplay} axiom_references - Axiom precision/recall badges
+ * @property {ReferenceDisplay} reality_references - Reality precision/recall badges
+ * @property {string[]} entity_score_pcts - Formatted percentage per entity accuracy result
+ * @property {string} highlighted_expected - Expected answer HTML with entities and references highlighted
+ * @property {string} highlighted_llm - LLM response HTML with entities and references highlighted
+ */
+
 /**
  * @typedef {Object} MetricSummary
  * @property {number} mean - Mean value of the metric
@@ -80,6 +101,9 @@
  * @property {MetricSummary} [reality_recall_metric] - Reality recall metric summary
  * @property {AxiomItem[]} [axiom_definitions] - Axiom definitions (optional)
  * @property {RealityItem[]} [reality_definitions] - Reality item definitions (optional)
+ * @property {Object<string, number>} entity_colors - Color index per entity name
+ * @property {Object<string, string>} summary - Formatted summary statistics keyed by statistic (e.g., "avg_accuracy")
+ * @property {EvaluationDisplay[]} evaluation_display - Precomputed display values, one per evaluation output
  */
 
 /**
@@ -119,64 +143,56 @@ function escapeHtml(unsafe) {
 // Global State
 // ============================================================================
 
-/** @type {Map<string, number>} Maps entity names to their assigned color index */
-const entityColorMap = new Map();
-
-/** @type {number} Counter for assigning sequential color indices */
-let colorIndex = 0;
+/**
+ * Maps entity names to their color index. Colors are assigned during report
+ * generation (entity_colors in evaluation_data.json) so the same entity always
+ * has the same color across all evaluations.
+ * @type {Map<string, number>}
+ */
+let entityColorMap = new Map();
 
 /**
- * Gets or assigns a consistent color index for a given entity.
- * Colors are assigned sequentially and cycle through 20 available colors.
+ * Gets the color index assigned to an entity.
  * @param {string} entity - The entity name to get a color for
  * @returns {number} The color index (0-19) for the entity
  */
 function getEntityColor(entity) {
-    if (!entityColorMap.has(entity)) {
-        entityColorMap.set(entity, colorIndex % 20);
-        colorIndex++;
-    }
-    return entityColorMap.get(entity);
+    return entityColorMap.get(entity) ?? 0;
 }
 
 /**
- * Determines the CSS class name based on a score value.
- * Used for color-coding scores as good (green), medium (yellow), or poor (red).
- * @param {number} score - The score value between 0 and 1
- * @returns {string} CSS class name: 'score-good', 'score-medium', or 'score-poor'
- */
-function getScoreClass(score) {
-    if (score >= 0.7) return 'score-good';
-    if (score >= 0.4) return 'score-medium';
-    return 'score-poor';
-}
-
-/**
- * Creates an HTML score badge with appropriate color styling.
+ * Renders an HTML score badge from a precomputed class and percentage.
  * @param {string} label - The label to display (e.g., "Accuracy", "Coverage")
- * @param {number} score - The score value between 0 and 1
+ * @param {string} scoreClass - Score CSS class (e.g., "score-good")
+ * @param {string} percent - Formatted percentage (e.g., "75%")
  * @param {string} [extraClass] - Optional additional CSS class (e.g., "score-accuracy")
  * @returns {string} HTML string for the score badge
  */
-function createScoreBadge(label, score, extraClass = '') {
-    const scoreClass = getScoreClass(score);
+function renderScoreBadge(label, scoreClass, percent, extraClass = '') {
     const classes = extraClass ? `score-badge ${extraClass} ${scoreClass}` : `score-badge ${scoreClass}`;
-    return `<div class="${classes}">${label}: ${(score * 100).toFixed(0)}%</div>`;
+    return `<div class="${classes}">${label}: ${percent}</div>`;
 }
 
+// Cache of convertLineBreaks results keyed by source text; contexts,
+// reasoning items and reasons are often repeated across evaluations
+const lineBreakCache = new Map();
+
 /**
  * Converts line break characters to HTML <br> tags and markdown bold to HTML <b> tags.
+ * The text is HTML-escaped first, so only the generated tags are markup.
  * Handles various line break formats (CRLF, LF, CR) for cross-platform compatibility.
  * @param {string} text - The text to convert
  * @returns {string} HTML-formatted text with line breaks and bold formatting
  */
 function convertLineBreaks(text) {
     if (!text) return text;
-    return text
-        .replace(/\r\n/g, '<br>')
-        .replace(/\n/g, '<br>')
-        .replace(/\r/g, '<br>')
+    const cached = lineBreakCache.get(text);
+    if (cached !== undefined) return cached;
+    const converted = escapeHtml(text)
+        .replace(/\r\n?|\n/g, '<br>')
         .replace(/\*\*(.*?)\*\*/g, '<b>$1</b>');
+    lineBreakCache.set(text, converted);
+    return converted;
 }
 
 /**
@@ -193,122 +209,6 @@ function formatReasoning(reasoning) {
     return convertLineBreaks(reasoning);
 }
 
-/**
- * Searches for entities in text using case-insensitive whole-word matching.
- * Only returns entities that are found as complete words in the text.
- * @param {string} text - The text to search in
- * @param {Array<string>} entities - Array of entity strings to search for
- * @returns {Array<string>} Array of entities found in the text
- */
-function findEntitiesInText(text, entities) {
-    if (!text || !entities || entities.length === 0) {
-        return [];
-    }
-
-    const foundEntities = [];
-    entities.forEach(entity => {
-        // Create a case-insensitive regex that matches whole words
-        const regex = new RegExp(
-            `\\b${entity.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')}\\b`,
-            'gi'
-        );
-        if (regex.test(text)) {
-            foundEntities.push(entity);
-        }
-    });
-
-    return foundEntities;
-}
-
-/**
- * Highlights axiom and reality references in text by wrapping them with tooltip spans.
- * Matches patterns like [A-001], [A-002], [R-001], [R-002], etc.
- * @param {string} text - The text to search for references
- * @param {Map<string, string>} axiomDefinitionsMap - Map from axiom ID to description
- * @param {Map<string, string>} realityDefinitionsMap - Map from reality ID to description
- * @returns {string} HTML text with reference tooltips
- */
-function highlightReferencesInText(text, axiomDefinitionsMap, realityDefinitionsMap) {
-    if (!text) {
-        return '';
-    }
-
-    // Match patterns like [A-001], [A-002], [R-001], [R-002], etc.
-    // The pattern captures the full reference including brackets
-    // Limit the numeric part to 1–4 digits to avoid matching excessively long IDs
-    const referencePattern = /\[(A-\d{1,4}|R-\d{1,4})\]/g;
-
-    return text.replace(referencePattern, (match, refId) => {
-        const isAxiom = refId.startsWith('A-');
-        const definitionsMap = isAxiom ? axiomDefinitionsMap : realityDefinitionsMap;
-        const description = definitionsMap.get(refId);
-
-        if (description) {
-            const escapedDescription = escapeHtml(description);
-            const tagClass = isAxiom ? 'inline-axiom-ref' : 'inline-reality-ref';
-            return `<span class="inline-reference ${tagClass}" data-tooltip="${escapedDescription}" tabindex="0">[${refId}]</span>`;
-        }
-        // If no description found, return the match unchanged
-        return match;
-    });
-}
-
-/**
- * Highlights entities in text by wrapping them with colored spans.
- * Also highlights axiom/reality references with tooltips if definition maps are provided.
- * Entities are sorted by length (longest first) to avoid partial matches.
- * Each entity gets a consistent color based on its assigned color index.
- * 
- * IMPORTANT: Entity highlighting is applied FIRST on the raw text (including
- * any reference markers like [A-001]), and reference highlighting is applied
- * SECOND. Because of this order, entity patterns can match inside reference
- * markers before they are wrapped in tooltip spans, so entity patterns should
- * be chosen carefully to avoid interfering with reference matching.
- * 
- * @param {string} text - The text to highlight entities in
- * @param {Array<string>} entities - Array of entity strings to highlight
- * @param {Map<string, string>} [axiomDefinitionsMap] - Optional map from axiom ID to description
- * @param {Map<string, string>} [realityDefinitionsMap] - Optional map from reality ID to description
- * @returns {string} HTML text with highlighted entities and converted line breaks
- */
-function highlightEntitiesInText(text, entities, axiomDefinitionsMap, realityDefinitionsMap) {
-    if (!text || !entities || entities.length === 0) {
-        // Still apply reference highlighting even if no entities
-        let result = text;
-        if (axiomDefinitionsMap && realityDefinitionsMap) {
-            result = highlightReferencesInText(result, axiomDefinitionsMap, realityDefinitionsMap);
-        }
-        return convertLineBreaks(result);
-    }
-
-    let highlightedText = text;
-
-    // FIRST: Highlight entities in plain text (before any HTML is added)
-    // Sort entities by length (longest first) to avoid partial matches
-    const sortedEntities = [...entities].sort((a, b) => b.length - a.length);
-
-    sortedEntities.forEach(entity => {
-        const colorClass = `entity-color-${getEntityColor(entity)}`;
-        // Create a case-insensitive regex that matches whole words
-        const regex = new RegExp(
-            `\\b${entity.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')}\\b`,
-            'gi'
-        );
-        highlightedText = highlightedText.replace(
-            regex,
-            `<span class="entity-highlight ${colorClass}">${entity}</span>`
-        );
-    });
-
-    // SECOND: Highlight axiom/reality references AFTER entity highlighting
-    // This ensures we don't match entities inside tooltip data-attributes
-    if (axiomDefinitionsMap && realityDefinitionsMap) {
-        highlightedText = highlightReferencesInText(highlightedText, axiomDefinitionsMap, realityDefinitionsMap);
-    }
-
-    return convertLineBreaks(highlightedText);
-}
-
 /**
  * Builds a lookup map from definitions array for quick ID-to-description lookup.
  * Works with both axiom definitions (axiom_id) and reality definitions (reality_id).
@@ -354,17 +254,17 @@ function renderReferenceTag(refId, tagClass, definitionsMap) {
  * Reference tags display tooltips with descriptions when definitions are provided.
  * @param {string} title - The title for the section (e.g., "Axiom References")
  * @param {ReferenceResults|null|undefined} references - Reference evaluation results
+ * @param {ReferenceDisplay} referenceDisplay - Precomputed precision/recall badge classes and percentages
  * @param {Map<string, string>} [definitionsMap] - Optional map from ID to description for tooltips
  * @returns {string} HTML string containing the references comparison section, or empty string if no references
  */
-function renderReferences(title, references, definitionsMap) {
+function renderReferences(title, references, referenceDisplay, definitionsMap) {
     if (!references) {
         return '';
     }
 
     const defMap = definitionsMap || new Map();
-    const precisionClass = getScoreClass(references.precision);
-    const recallClass = getScoreClass(references.recall);
+    const expectedSet = new Set(references.references_expected);
 
     return `
         <div class="references-section">
@@ -385,7 +285,7 @@ function renderReferences(title, references, definitionsMap) {
                     <div class="reference-list">
                         ${references.references_found.length > 0 ?
             references.references_found.map(ref => {
-                const isMatch = references.references_expected.includes(ref);
+                const isMatch = expectedSet.has(ref);
                 const tagClass = isMatch ? 'found-match-tag' : 'found-nomatch-tag';
                 return renderReferenceTag(ref, tagClass, defMap);
             }).join('') :
@@ -394,82 +294,58 @@ function renderReferences(title, references, definitionsMap) {
                 </div>
             </div>
             <div class="references-metrics">
-                <span class="score-badge ${precisionClass}">Precision: ${(references.precision * 100).toFixed(0)}%</span>
-                <span class="score-badge ${recallClass}">Recall: ${(references.recall * 100).toFixed(0)}%</span>
+                <span class="score-badge ${referenceDisplay.precision_class}">Precision: ${referenceDisplay.precision_pct}</span>
+                <span class="score-badge ${referenceDisplay.recall_class}">Recall: ${referenceDisplay.recall_pct}</span>
             </div>
         </div>
     `;
 }
 
 /**
- * Renders entity information in a three-column grid layout.
- * Displays query entities, expected answer entities, and LLM answer entities.
+ * Renders one card of the entities grid for a single entity source.
  * Each entity pair shows trigger variable → consequence variable with consistent colors.
- * @param {Entities} entities - Object containing three arrays of entity pairs
- * @returns {string} HTML string containing the entities grid layout
+ * @param {string} title - The card heading (e.g., "Query Entities")
+ * @param {EntityPair[]} entityList - The entity pairs to display
+ * @returns {string} HTML string for the entity card
  */
-function renderEntities(entities) {
+function renderEntityGroup(title, entityList) {
     return `
-        <div class="entities">
-            <h4>Identified Entities</h4>
-            <div class="entity-grid">
-                <div class="entity-card">
-                    <h5>Query Entities</h5>
-                    <div class="entity-list">
-                        ${entities.user_query_entities.length > 0 ?
-            entities.user_query_entities.map(entity => `
-                            <div class="entity-pair">
-                                <span class="entity-tag entity-color-${getEntityColor(entity.trigger_variable)
-                }">${entity.trigger_variable}</span>
-                                <span style="color: #666; margin: 0 5px;">
-                                    →
-                                </span>
-                                <span class="entity-tag entity-color-${getEntityColor(entity.consequence_variable)
-                }">${entity.consequence_variable}</span>
-                            </div>
-                        `).join('') :
-            '<p style="color: #666; font-style: italic;">' +
-            'No entities identified</p>'}
-                    </div>
-                </div>
-                <div class="entity-card">
-                    <h5>Expected Answer Entities</h5>
-                    <div class="entity-list">
-                        ${entities.expected_answer_entities.length > 0 ?
-            entities.expected_answer_entities.map(entity => `
-                            <div class="entity-pair">
-                                <span class="entity-tag entity-color-${getEntityColor(entity.trigger_variable)
-                }">${entity.trigger_variable}</span>
-                                <span style="color: #666; margin: 0 5px;">
-                                    →
-                                </span>
-                                <span class="entity-tag entity-color-${getEntityColor(entity.consequence_variable)
-                }">${entity.consequence_variable}</span>
-                            </div>
-                        `).join('') :
-            '<p style="color: #666; font-style: italic;">' +
-            'No entities identified</p>'}
-                    </div>
-                </div>
                 <div class="entity-card">
-                    <h5>LLM Answer Entities</h5>
+                    <h5>${title}</h5>
                     <div class="entity-list">
-                        ${entities.llm_answer_entities.length > 0 ?
-            entities.llm_answer_entities.map(entity => `
+                        ${entityList.length > 0 ?
+            entityList.map(entity => `
                             <div class="entity-pair">
                                 <span class="entity-tag entity-color-${getEntityColor(entity.trigger_variable)
-                }">${entity.trigger_variable}</span>
+                }">${escapeHtml(entity.trigger_variable)}</span>
                                 <span style="color: #666; margin: 0 5px;">
                                     →
                                 </span>
                                 <span class="entity-tag entity-color-${getEntityColor(entity.consequence_variable)
-                }">${entity.consequence_variable}</span>
+                }">${escapeHtml(entity.consequence_variable)}</span>
                             </div>
                         `).join('') :
             '<p style="color: #666; font-style: italic;">' +
             'No entities identified</p>'}
                     </div>
                 </div>
+    `;
+}
+
+/**
+ * Renders entity information in a three-column grid layout.
+ * Displays query entities, expected answer entities, and LLM answer entities.
+ * @param {Entities} entities - Object containing three arrays of entity pairs
+ * @returns {string} HTML string containing the entities grid layout
+ */
+function renderEntities(entities) {
+    return `
+        <div class="entities">
+            <h4>Identified Entities</h4>
+            <div class="entity-grid">
+                ${renderEntityGroup('Query Entities', entities.user_query_entities)}
+                ${renderEntityGroup('Expected Answer Entities', entities.expected_answer_entities)}
+                ${renderEntityGroup('LLM Answer Entities', entities.llm_answer_entities)}
             </div>
         </div>
     `;
@@ -479,26 +355,27 @@ function renderEntities(entities) {
  * Renders detailed accuracy information showing entity-level scores and reasons.
  * Displays each entity's accuracy score as a percentage with explanatory text.
  * @param {AccuracyResults} accuracy - Accuracy evaluation results
+ * @param {string[]} scorePcts - Formatted percentage per entity accuracy result, in the same order
  * @returns {string} HTML string containing the accuracy details section
  */
-function renderAccuracyDetails(accuracy) {
+function renderAccuracyDetails(accuracy, scorePcts) {
     return `
         <div class="accuracy-details">
             <h5>Entity-Level Accuracy</h5>
-            ${accuracy.entity_accuracies.map(result => `
+            ${accuracy.entity_accuracies.map((result, index) => `
                 <div class="accuracy-result">
                     <div>
                         <div class="accuracy-entity">
-                            <span class="entity-tag entity-color-${getEntityColor(result.entity.trigger_variable)}">${result.entity.trigger_variable}</span>
+                            <span class="entity-tag entity-color-${getEntityColor(result.entity.trigger_variable)}">${escapeHtml(result.entity.trigger_variable)}</span>
                             <span style="color: #666; margin: 0 5px;">→</span>
-                            <span class="entity-tag entity-color-${getEntityColor(result.entity.consequence_variable)}">${result.entity.consequence_variable}</span>
+                            <span class="entity-tag entity-color-${getEntityColor(result.entity.consequence_variable)}">${escapeHtml(result.entity.consequence_variable)}</span>
                         </div>
                         <div class="accuracy-reason">
                             ${convertLineBreaks(result.reason)}
                         </div>
                     </div>
                     <div class="accuracy-score">
-                        ${(result.score * 100).toFixed(0)}%
+                        ${scorePcts[index]}
                     </div>
                 </div>
             `).join('')}
@@ -509,89 +386,36 @@ function renderAccuracyDetails(accuracy) {
 /**
  * Renders a complete evaluation item with collapsible content.
  * Includes query, expected/LLM responses with entity highlighting, scores, and detailed analysis.
- * Only highlights entities that appear in both expected and LLM responses for clarity.
+ * The responses are highlighted during report generation (see highlight.py); only entities
+ * that appear in both expected and LLM responses are highlighted for clarity.
  * @param {EvaluationOutput} evaluation - Complete evaluation object containing input, responses, and scores
+ * @param {EvaluationDisplay} display - Precomputed score classes, percentages and highlighted responses
  * @param {Map<string, string>} axiomDefinitionsMap - Map from axiom ID to description
  * @param {Map<string, string>} realityDefinitionsMap - Map from reality ID to description
  * @returns {string} HTML string containing the full evaluation display
  */
-function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap) {
-    const accuracyScore = evaluation.accuracy.accuracy_mean;
-    const coverageScore = evaluation.topic_coverage.coverage_score;
-    const axiomPrecisionScore = evaluation.axiom_references?.precision ?? 0;
-    const axiomRecallScore = evaluation.axiom_references?.recall ?? 0;
-    const realityPrecisionScore = evaluation.reality_references?.precision ?? 0;
-    const realityRecallScore = evaluation.reality_references?.recall ?? 0;
-
-    // Collect all entities for analysis
-    const allEntityValues = [];
-
-    // Extract trigger and consequence variables from all entity objects
-    [evaluation.entities.user_query_entities,
-    evaluation.entities.llm_answer_entities,
-    evaluation.entities.expected_answer_entities].forEach(entityList => {
-        if (Array.isArray(entityList)) {
-            entityList.forEach(entity => {
-                if (entity.trigger_variable) {
-                    allEntityValues.push(entity.trigger_variable);
-                }
-                if (entity.consequence_variable) {
-                    allEntityValues.push(entity.consequence_variable);
-                }
-            });
-        }
-    });
-
-    // Remove duplicates
-    const uniqueEntities = [...new Set(allEntityValues)];
-
-    // Find entities that exist in both texts
-    const entitiesInExpected = findEntitiesInText(
-        evaluation.input.expected_answer,
-        uniqueEntities
-    );
-    const entitiesInLlm = findEntitiesInText(
-        evaluation.llm_response,
-        uniqueEntities
-    );
-
-    // Only highlight entities that appear in BOTH texts
-    const commonEntities = entitiesInExpected.filter(entity =>
-        entitiesInLlm.includes(entity)
-    );
-
-    // Highlight only common entities in response texts, plus axiom/reality references with tooltips
-    const highlightedExpectedAnswer = highlightEntitiesInText(
-        evaluation.input.expected_answer,
-        commonEntities,
-        axiomDefinitionsMap,
-        realityDefinitionsMap
-    );
-    const highlightedLlmResponse = highlightEntitiesInText(
-        evaluation.llm_response,
-        commonEntities,
-        axiomDefinitionsMap,
-        realityDefinitionsMap
-    );
+function renderEvaluation(evaluation, display, axiomDefinitionsMap, realityDefinitionsMap) {
+    const axiomDisplay = display.axiom_references;
+    const realityDisplay = display.reality_references;
 
     return `
         <div class="evaluation-item">
             <div class="evaluation-header collapsed" role="button" tabindex="0" aria-expanded="false" onclick="toggleEvaluation(this)">
                 <div class="evaluation-id">Evaluation #${evaluation.input.id}</div>
                 <div class="scores">
-                    ${createScoreBadge('Accuracy', accuracyScore, 'score-accuracy')}
-                    ${createScoreBadge('Coverage', coverageScore, 'score-coverage')}
-                    ${createScoreBadge('Axiom P', axiomPrecisionScore)}
-                    ${createScoreBadge('Axiom R', axiomRecallScore)}
-                    ${createScoreBadge('Reality P', realityPrecisionScore)}
-                    ${createScoreBadge('Reality R', realityRecallScore)}
+                    ${renderScoreBadge('Accuracy', display.accuracy_class, display.accuracy_pct, 'score-accuracy')}
+                    ${renderScoreBadge('Coverage', display.coverage_class, display.coverage_pct, 'score-coverage')}
+                    ${renderScoreBadge('Axiom P', axiomDisplay.precision_class, axiomDisplay.precision_pct)}
+                    ${renderScoreBadge('Axiom R', axiomDisplay.recall_class, axiomDisplay.recall_pct)}
+                    ${renderScoreBadge('Reality P', realityDisplay.precision_class, realityDisplay.precision_pct)}
+                    ${renderScoreBadge('Reality R', realityDisplay.recall_class, realityDisplay.recall_pct)}
                 </div>
             </div>
             <div class="evaluation-content collapsed">
 
             <div class="query">
                 <h3>Query</h3>
-                <p>${evaluation.input.query}</p>
+                <p>${escapeHtml(evaluation.input.query)}</p>
                 <div class="context">
                     <strong>Context:</strong> ${convertLineBreaks(evaluation.input.context)}
                 </div>
@@ -603,7 +427,7 @@ function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap
                         Expected Answer
                     </div>
                     <div class="response-content">
-                        ${highlightedExpectedAnswer}
+                        ${display.highlighted_expected}
                     </div>
                 </div>
                 <div class="response-card">
@@ -611,7 +435,7 @@ function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap
                         LLM Response
                     </div>
                     <div class="response-content">
-                        ${highlightedLlmResponse}
+                        ${display.highlighted_llm}
                     </div>
                 </div>
             </div>
@@ -621,8 +445,8 @@ function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap
                 ${formatReasoning(evaluation.input.reasoning)}
             </div>
 
-            ${renderReferences('Axiom References', evaluation.axiom_references, axiomDefinitionsMap)}
-            ${renderReferences('Reality References', evaluation.reality_references, realityDefinitionsMap)}
+            ${renderReferences('Axiom References', evaluation.axiom_references, axiomDisplay, axiomDefinitionsMap)}
+            ${renderReferences('Reality References', evaluation.reality_references, realityDisplay, realityDefinitionsMap)}
 
             ${renderEntities(evaluation.entities)}
 
@@ -631,17 +455,17 @@ function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap
                 <div class="score-item">
                     <div class="score-header">
                         <h5>Accuracy (Mean)</h5>
-                        <span class="score-badge ${getScoreClass(accuracyScore)}">
-                            ${(accuracyScore * 100).toFixed(0)}%
+                        <span class="score-badge ${display.accuracy_class}">
+                            ${display.accuracy_pct}
                         </span>
                     </div>
-                    ${renderAccuracyDetails(evaluation.accuracy)}
+                    ${renderAccuracyDetails(evaluation.accuracy, display.entity_score_pcts)}
                 </div>
                 <div class="score-item">
                     <div class="score-header">
                         <h5>Topic Coverage</h5>
-                        <span class="score-badge ${getScoreClass(coverageScore)}">
-                            ${(coverageScore * 100).toFixed(0)}%
+                        <span class="score-badge ${display.coverage_class}">
+                            ${display.coverage_pct}
                         </span>
                     </div>
                     <div class="score-reason">${convertLineBreaks(evaluation.topic_coverage.reason)}</div>
@@ -653,104 +477,26 @@ function renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap
 }
 
 /**
- * Pre-processes all evaluation data to assign consistent colors to entities.
- * Ensures the same entity always gets the same color across all evaluations.
- * Collects all unique entities and assigns them sequential color indices.
- * @returns {void}
- */
-function initializeEntityColors() {
-    // Pre-process all entities to assign consistent colors
-    const allEntities = new Set();
-
-    window.evaluationData.evaluation_outputs.forEach(evaluation => {
-        const entities = evaluation.entities;
-
-        // Collect all unique entities from the structure
-        Object.values(entities).forEach(entityGroup => {
-            if (Array.isArray(entityGroup)) {
-                entityGroup.forEach(entity => {
-                    if (entity.trigger_variable) {
-                        allEntities.add(entity.trigger_variable);
-                    }
-                    if (entity.consequence_variable) {
-                        allEntities.add(entity.consequence_variable);
-                    }
-                });
-            }
-        });
-    });
-
-    // Assign colors to all unique entities
-    Array.from(allEntities).sort().forEach(entity => {
-        getEntityColor(entity);
-    });
-}
-
-/**
- * Displays summary statistics from pre-calculated metrics in the evaluation data.
- * Updates the summary statistics section at the top of the report.
- * Includes defensive checks for missing metric fields.
+ * Displays the summary statistics precomputed at report generation time.
+ * Each summary key maps to the element with the same id (underscores
+ * replaced by hyphens) in the summary statistics section.
  * @returns {void}
  */
 function calculateSummaryStats() {
-    const data = window.evaluationData;
-    const totalEvaluations = data.evaluation_outputs?.length ?? 0;
-
-    // Use pre-calculated metrics from the JSON with defensive null checks
-    const avgAccuracy = data.accuracy?.mean ?? 0;
-    const avgCoverage = data.topic_coverage?.mean ?? 0;
-    const avgAxiomPrecision = data.axiom_precision_metric?.mean ?? 0;
-    const avgAxiomRecall = data.axiom_recall_metric?.mean ?? 0;
-    const avgRealityPrecision = data.reality_precision_metric?.mean ?? 0;
-    const avgRealityRecall = data.reality_recall_metric?.mean ?? 0;
-
-    // Overall score is the unweighted average of all 6 evaluation metrics:
-    // - Accuracy: How well the LLM response matches the expected answer
-    // - Coverage: How well the response covers the expected topics
-    // - Axiom Precision: Proportion of cited axioms that are relevant
-    // - Axiom Recall: Proportion of relevant axioms that were cited
-    // - Reality Precision: Proportion of cited reality facts that are relevant
-    // - Reality Recall: Proportion of relevant reality facts that were cited
-    const overallScore = (
-        avgAccuracy +
-        avgCoverage +
-        avgAxiomPrecision +
-        avgAxiomRecall +
-        avgRealityPrecision +
-        avgRealityRecall
-    ) / 6;
-
-    // Safely update summary statistics elements
-    const totalEl = document.getElementById('total-evaluations');
-    if (totalEl) totalEl.textContent = totalEvaluations;
-
-    const accuracyEl = document.getElementById('avg-accuracy');
-    if (accuracyEl) accuracyEl.textContent = avgAccuracy.toFixed(2);
-
-    const coverageEl = document.getElementById('avg-coverage');
-    if (coverageEl) coverageEl.textContent = avgCoverage.toFixed(2);
-
-    const axiomPrecisionEl = document.getElementById('avg-axiom-precision');
-    if (axiomPrecisionEl) axiomPrecisionEl.textContent = avgAxiomPrecision.toFixed(2);
-
-    const axiomRecallEl = document.getElementById('avg-axiom-recall');
-    if (axiomRecallEl) axiomRecallEl.textContent = avgAxiomRecall.toFixed(2);
-
-    const realityPrecisionEl = document.getElementById('avg-reality-precision');
-    if (realityPrecisionEl) realityPrecisionEl.textContent = avgRealityPrecision.toFixed(2);
-
-    const realityRecallEl = document.getElementById('avg-reality-recall');
-    if (realityRecallEl) realityRecallEl.textContent = avgRealityRecall.toFixed(2);
-
-    const overallEl = document.getElementById('overall-score');
-    if (overallEl) overallEl.textContent = overallScore.toFixed(2);
+    const summary = window.evaluationData.summary ?? {};
+
+    for (const [key, value] of Object.entries(summary)) {
+        const element = document.getElementById(key.replaceAll('_', '-'));
+        if (element) element.textContent = value;
+    }
 }
 
 /**
  * Renders all evaluation items and inserts them into the DOM.
  * Processes each evaluation through renderEvaluation() and concatenates the results.
- * Updates the evaluations container with the complete HTML content.
- * Attaches keyboard event handlers to evaluation headers for accessibility.
+ * The HTML is parsed into a detached template's DocumentFragment, which is
+ * inserted into the evaluations container in a single replaceChildren() call.
+ * Attaches one delegated keyboard event handler to the container for accessibility.
  * @returns {void}
  */
 function renderEvaluations() {
@@ -764,22 +510,32 @@ function renderEvaluations() {
     const axiomDefinitionsMap = buildDefinitionsMap(window.evaluationData.axiom_definitions);
     const realityDefinitionsMap = buildDefinitionsMap(window.evaluationData.reality_definitions);
 
+    // Score classes and percentages precomputed during report generation
+    const evaluationDisplay = window.evaluationData.evaluation_display;
+
     const evaluationsHtml = window.evaluationData.evaluation_outputs
-        .map(evaluation => renderEvaluation(evaluation, axiomDefinitionsMap, realityDefinitionsMap))
+        .map((evaluation, index) => renderEvaluation(
+            evaluation,
+            evaluationDisplay[index],
+            axiomDefinitionsMap,
+            realityDefinitionsMap
+        ))
         .join('');
 
-    container.innerHTML = evaluationsHtml;
-
-    // Attach keyboard event handlers for accessibility
-    const headers = container.querySelectorAll('.evaluation-header');
-    headers.forEach(header => {
-        header.addEventListener('keydown', (event) => {
-            // Trigger toggle on Enter or Space key
-            if (event.key === 'Enter' || event.key === ' ') {
-                event.preventDefault(); // Prevent page scroll on Space
-                toggleEvaluation(header);
-            }
-        });
+    // Parse off-document (no style or layout work while parsing), then
+    // attach the whole fragment at once
+    const template = document.createElement('template');
+    template.innerHTML = evaluationsHtml;
+    container.replaceChildren(template.content);
+
+    // One delegated handler instead of a listener per evaluation header
+    container.addEventListener('keydown', (event) => {
+        const header = event.target.closest?.('.evaluation-header');
+        // Trigger toggle on Enter or Space key
+        if (header && (event.key === 'Enter' || event.key === ' ')) {
+            event.preventDefault(); // Prevent page scroll on Space
+            toggleEvaluation(header);
+        }
     });
 }
 
@@ -974,7 +730,7 @@ fetch('evaluation_data.json')
         window.evaluationData = evaluationData;
 
         // Initialize the page
-        initializeEntityColors();
+        entityColorMap = new Map(Object.entries(evaluationData.entity_colors));
         calculateSummaryStats();
         renderEvaluations();
         renderAxiomDefinitions();
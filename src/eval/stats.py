@@ -0,0 +1,86 @@
+"""Aggregated statistics over evaluation outputs."""
+
+import numpy as np
+
+from eval.models import (
+    AxiomItem,
+    EvaluationResult,
+    EvaluationSampleOutput,
+    Metric,
+    RealityItem,
+)
+
+
+def calculate_stats(
+    evaluation_results: list[EvaluationSampleOutput],
+    axiom_definitions: list[AxiomItem] | None = None,
+    reality_definitions: list[RealityItem] | None = None,
+) -> EvaluationResult:
+    """
+    Calculate statistical metrics from evaluation results.
+
+    Args:
+        evaluation_results: Collection of evaluation outputs to analyze
+        axiom_definitions: Optional list of axiom items to include in results
+        reality_definitions: Optional list of reality items to include in
+            results
+
+    Returns:
+        EvaluationResult: Object containing the evaluation outputs and computed
+        statistical metrics including accuracy and topic coverage.
+    """
+    if not evaluation_results:
+        return EvaluationResult(
+            evaluation_outputs=[],
+            accuracy=Metric(mean=0.0, std=0.0),
+            topic_coverage=Metric(mean=0.0, std=0.0),
+            axiom_precision_metric=Metric(mean=0.0, std=0.0),
+            axiom_recall_metric=Metric(mean=0.0, std=0.0),
+            reality_precision_metric=Metric(mean=0.0, std=0.0),
+            reality_recall_metric=Metric(mean=0.0, std=0.0),
+            axiom_definitions=axiom_definitions,
+            reality_definitions=reality_definitions,
+        )
+
+    # Gather every per-sample score into one (samples x metrics) matrix and
+    # reduce all columns in a single pass. Columns: accuracy, topic coverage,
+    # axiom precision, axiom recall, reality precision, reality recall.
+    scores = np.array(
+        [
+            (
+                result.accuracy.accuracy_mean,
+                result.topic_coverage.coverage_score,
+                result.axiom_references.precision,
+                result.axiom_references.recall,
+                result.reality_references.precision,
+                result.reality_references.recall,
+            )
+            for result in evaluation_results
+        ],
+        dtype=np.float64,
+    )
+    (
+        accuracy,
+        topic_coverage,
+        axiom_precision,
+        axiom_recall,
+        reality_precision,
+        reality_recall,
+    ) = (
+        Metric(mean=float(mean), std=float(std))
+        for mean, std in zip(
+            scores.mean(axis=0), scores.std(axis=0), strict=True
+        )
+    )
+
+    return EvaluationResult(
+        evaluation_outputs=evaluation_results,
+        accuracy=accuracy,
+        topic_coverage=topic_coverage,
+        axiom_precision_metric=axiom_precision,
+        axiom_recall_metric=axiom_recall,
+        reality_precision_metric=reality_precision,
+        reality_recall_metric=reality_recall,
+        axiom_definitions=axiom_definitions,
+        reality_definitions=reality_definitions,
+    )
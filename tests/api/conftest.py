@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from contextlib import ExitStack
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -5,5 +8,15 @@ from api.main import app
 
 
 @pytest.fixture(scope="session")
-def test_client() -> TestClient:
-    return TestClient(app)
+def test_client(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[TestClient]:
+    # Entering the client runs the app lifespan once and keeps a single
+    # event loop portal open for every request in the session.
+    with ExitStack() as stack:
+        # The lifespan writes .api-config.json to the working directory;
+        # start it from a temporary one so the developer's config is kept.
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.chdir(tmp_path_factory.mktemp("api"))
+            client = stack.enter_context(TestClient(app))
+        yield client
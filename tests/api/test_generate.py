@@ -1,30 +1,30 @@
 import base64
-import json
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, replace
-from typing import Final
+from typing import Any, Final
 
 import pytest
 from pydantic import ValidationError
+from pydantic_core import to_json
 from tests.core.reality_test_data import reality_statement
 
 from api.generate import GenerateRequest
 from core.reality import RealityStatement
 
 REALITY: Final = [reality_statement(1), reality_statement(2)]
+REALITY_DICTS: Final = [asdict(statement) for statement in REALITY]
 
 
 def reality_base64_json(reality: list[RealityStatement]) -> str:
-    reality_dicts = [asdict(statement) for statement in reality]
-    reality_json = json.dumps(reality_dicts)
-    reality_base64 = base64.b64encode(reality_json.encode()).decode()
-    return reality_base64
+    # to_json serializes the dataclasses straight to UTF-8 bytes
+    return base64.b64encode(to_json(reality)).decode("ascii")
 
 
 @dataclass(frozen=True)
 class RequestFixture:
     question: str
-    reality: str
+    # Base64-encoded JSON, or the decoded list of reality statement dicts
+    reality: str | list[dict[str, Any]]
     session_id: str = "test-session-123"
 
 
@@ -40,8 +40,12 @@ def predicate(predicate: Callable[[GenerateRequest], bool]):
     return predicate
 
 
-DESERIALIZATION_SUCCESS_TEST_DATA: Final = [
-    pytest.param(
+# (id, request, predicate) cases, serialized once per payload form below
+DESERIALIZATION_SUCCESS_CASES: Final[
+    list[tuple[str, RequestFixture, Callable[[GenerateRequest], bool]]]
+] = [
+    (
+        "Full request payload reality",
         DEFAULT_REQUEST,
         predicate(
             lambda actual: actual
@@ -53,13 +57,10 @@ DESERIALIZATION_SUCCESS_TEST_DATA: Final = [
                 session_id="test-session-123",
             )
         ),
-        id="Full request payload reality",
     ),
-    pytest.param(
-        replace(
-            DEFAULT_REQUEST,
-            reality=[asdict(statement) for statement in REALITY],
-        ),
+    (
+        "Full request payload reality as python object",
+        replace(DEFAULT_REQUEST, reality=REALITY_DICTS),
         predicate(
             lambda actual: actual
             == GenerateRequest(
@@ -70,44 +71,56 @@ DESERIALIZATION_SUCCESS_TEST_DATA: Final = [
                 session_id="test-session-123",
             )
         ),
-        id="Full request payload reality as python object",
     ),
-    pytest.param(
+    (
+        "Empty reality",
         replace(DEFAULT_REQUEST, reality=[]),
         predicate(lambda actual: actual.reality == []),
-        id="Empty reality",
     ),
 ]
 
+DESERIALIZATION_FROM_JSON_TEST_DATA: Final = [
+    pytest.param(to_json(request), check, id=case_id)
+    for case_id, request, check in DESERIALIZATION_SUCCESS_CASES
+]
+
+DESERIALIZATION_FROM_PYTHON_TEST_DATA: Final = [
+    pytest.param(asdict(request), check, id=case_id)
+    for case_id, request, check in DESERIALIZATION_SUCCESS_CASES
+]
+
 
-@pytest.mark.parametrize("input, predicate", DESERIALIZATION_SUCCESS_TEST_DATA)
+@pytest.mark.parametrize(
+    "json_payload, predicate", DESERIALIZATION_FROM_JSON_TEST_DATA
+)
 def test_deserializes_payload_from_json(
-    input: RequestFixture, predicate: Callable[[GenerateRequest], bool]
+    json_payload: bytes, predicate: Callable[[GenerateRequest], bool]
 ):
-    assert predicate(
-        GenerateRequest.model_validate_json(json.dumps(asdict(input)))
-    )
+    assert predicate(GenerateRequest.model_validate_json(json_payload))
 
 
-@pytest.mark.parametrize("input, predicate", DESERIALIZATION_SUCCESS_TEST_DATA)
+@pytest.mark.parametrize(
+    "python_payload, predicate", DESERIALIZATION_FROM_PYTHON_TEST_DATA
+)
 def test_deserializes_payload_from_python(
-    input: RequestFixture, predicate: Callable[[GenerateRequest], bool]
+    python_payload: dict[str, Any],
+    predicate: Callable[[GenerateRequest], bool],
 ):
-    assert predicate(GenerateRequest.model_validate(asdict(input)))
+    assert predicate(GenerateRequest.model_validate(python_payload))
 
 
 @pytest.mark.parametrize(
-    "input, error",
+    "json_payload, error",
     [
         pytest.param(
-            replace(DEFAULT_REQUEST, question=""),
+            to_json(replace(DEFAULT_REQUEST, question="")),
             "String should have at least 1 character",
             id="Empty question",
         ),
     ],
 )
 def test_deserialization_failures_on_bad_request(
-    input: RequestFixture, error: str
+    json_payload: bytes, error: str
 ):
     with pytest.raises(ValidationError, match=error):
-        _ = GenerateRequest.model_validate_json(json.dumps(asdict(input)))
+        _ = GenerateRequest.model_validate_json(json_payload)
@@ -1,75 +1,119 @@
 import base64
-import json
 from collections.abc import Callable
 from dataclasses import asdict
-from typing import Final
+from typing import Any, Final
 
 import httpx
 import pytest
 from fastapi.testclient import TestClient
+from pydantic_core import from_json, to_json
 
 from core.reality import RealityId, RealityStatement
 
-
-def reality_as_base64():
-    """
-    Create realistic macro-economic reality statements for Switzerland.
-
-    Encode them as base64.
-    """
-    reality: Final = [
-        RealityStatement(
-            id=RealityId("R-001"),
-            description=(
-                "Current inflation rate in Switzerland is 2.1% as of Q3 2024."
-            ),
+# Realistic macro-economic reality statements for Switzerland
+REALITY: Final = [
+    RealityStatement(
+        id=RealityId("R-001"),
+        description=(
+            "Current inflation rate in Switzerland is 2.1% as of Q3 2024."
         ),
-        RealityStatement(
-            id=RealityId("R-002"),
-            description=(
-                "Swiss unemployment rate stands at 2.3%, among the "
-                "lowest in Europe."
-            ),
+    ),
+    RealityStatement(
+        id=RealityId("R-002"),
+        description=(
+            "Swiss unemployment rate stands at 2.3%, among the "
+            "lowest in Europe."
         ),
-        RealityStatement(
-            id=RealityId("R-003"),
-            description=(
-                "The Swiss National Bank (SNB) maintains a policy "
-                "interest rate of 1.75%."
-            ),
+    ),
+    RealityStatement(
+        id=RealityId("R-003"),
+        description=(
+            "The Swiss National Bank (SNB) maintains a policy "
+            "interest rate of 1.75%."
         ),
-    ]
-    reality_json = json.dumps([asdict(r) for r in reality])
-    reality_base64 = base64.b64encode(reality_json.encode()).decode()
-    return reality_base64
+    ),
+]
+
+# The statements as a native JSON array, built once at import
+REALITY_JSON: Final = [asdict(statement) for statement in REALITY]
+
+# The statements as base64-encoded JSON, the form the UI sends
+REALITY_BASE64: Final = base64.b64encode(to_json(REALITY_JSON)).decode("ascii")
 
 
 def collect_text_from_response(response: httpx.Response) -> str:
     """Extract and concatenate text chunks from an NDJSON response."""
     text_chunks: list[str] = []
-    for line in response.text.strip().split("\n"):
+    for line in response.content.splitlines():
         if not line.strip():
             continue
-        obj = json.loads(line)
+        obj = from_json(line)
         if obj.get("type") == "text":
             text_chunks.append(obj["text"])
     return "".join(text_chunks)
 
 
+# Fields every citation response line must carry
+CITATION_KEYS: Final = frozenset({"id", "description"})
+
+
+def validate_text(obj: dict[str, Any], text_chunks: list[str]) -> None:
+    """Validate a text response and collect its text."""
+    assert "text" in obj, "Text response missing 'text' field"
+    assert isinstance(obj["text"], str), "Text field must be a string"
+    text_chunks.append(obj["text"])
+
+
+def validate_axiom_citation(
+    obj: dict[str, Any], text_chunks: list[str]
+) -> None:
+    """Validate an axiom citation (constitution reference)."""
+    assert CITATION_KEYS <= obj.keys(), (
+        f"Axiom citation missing fields: {CITATION_KEYS - obj.keys()}"
+    )
+
+    # Validate id format
+    assert obj["id"].startswith("A-"), (
+        f"Axiom ID should start with 'A-': {obj['id']}"
+    )
+
+
+def validate_reality_citation(
+    obj: dict[str, Any], text_chunks: list[str]
+) -> None:
+    """Validate a reality citation (context reference)."""
+    assert CITATION_KEYS <= obj.keys(), (
+        f"Reality citation missing fields: {CITATION_KEYS - obj.keys()}"
+    )
+
+    # Validate id format
+    assert obj["id"].startswith("R-"), (
+        f"Reality ID should start with 'R-': {obj['id']}"
+    )
+
+
+# Response line validators, looked up by the line's 'type' field
+RESPONSE_VALIDATORS: Final[
+    dict[str, Callable[[dict[str, Any], list[str]], None]]
+] = {
+    "text": validate_text,
+    "axiom_citation": validate_axiom_citation,
+    "reality_citation": validate_reality_citation,
+}
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "reality",
     [
-        pytest.param(lambda: None, id="No reality"),
-        pytest.param(
-            reality_as_base64,
-            id="With reality",
-        ),
+        pytest.param(None, id="No reality"),
+        pytest.param(REALITY_JSON, id="With reality"),
+        pytest.param(REALITY_BASE64, id="With base64 reality"),
     ],
 )
 def test_generate_endpoint(
     test_client: TestClient,
-    reality: Callable[[], str | None],
+    reality: str | list[dict[str, str]] | None,
 ):
     """
     Test the /api/generate endpoint with and without reality statements.
@@ -87,66 +131,34 @@ def test_generate_endpoint(
             "How might interest rate changes affect "
             "borrowing costs given current economic conditions in Switzerland?"
         ),
-        "reality": reality(),
+        "reality": reality,
         "session_id": "test-session-123",
     }
 
-    # act
-    response = test_client.post(
-        "/api/generate", json=request
-    ).raise_for_status()
-
-    # assert
-    lines = [line for line in response.text.splitlines() if line]
-
-    assert len(lines) > 0, "Response should contain at least one line"
-
-    # Track what we've seen to validate the response contains expected elements
-    has_text = False
+    # act / assert - validate each NDJSON line as it is streamed
     text_chunks: list[str] = []
+    line_count = 0
 
-    for line in lines:
-        obj = json.loads(line)
+    with test_client.stream("POST", "/api/generate", json=request) as response:
+        _ = response.raise_for_status()
 
-        # All responses must have a 'type' field
-        assert "type" in obj, f"Response missing 'type' field: {obj}"
+        # Skip blank lines while streaming; no list of lines is built
+        for line in filter(None, response.iter_lines()):
+            line_count += 1
+            obj = from_json(line)
 
-        if obj["type"] == "text":
-            # Text response - validate structure
-            assert "text" in obj, "Text response missing 'text' field"
-            assert isinstance(obj["text"], str), "Text field must be a string"
-            has_text = True
-            text_chunks.append(obj["text"])
+            # All responses must have a 'type' field
+            assert "type" in obj, f"Response missing 'type' field: {obj}"
+
+            validate = RESPONSE_VALIDATORS.get(obj["type"])
+            if validate is None:
+                pytest.fail(f"Unexpected response type '{obj['type']}': {obj}")
+            validate(obj, text_chunks)
 
-        elif obj["type"] == "axiom_citation":
-            # Axiom citation (constitution reference) - validate structure
-            assert "id" in obj, "Axiom citation missing 'id' field"
-            assert "description" in obj, (
-                "Axiom citation missing 'description' field"
-            )
-
-            # Validate id format
-            assert obj["id"].startswith("A-"), (
-                f"Axiom ID should start with 'A-': {obj['id']}"
-            )
-
-        elif obj["type"] == "reality_citation":
-            # Reality citation (context reference) - validate structure
-            assert "id" in obj, "Reality citation missing 'id' field"
-            assert "description" in obj, (
-                "Reality citation missing 'description' field"
-            )
-
-            # Validate id format
-            assert obj["id"].startswith("R-"), (
-                f"Reality ID should start with 'R-': {obj['id']}"
-            )
-
-        else:
-            pytest.fail(f"Unexpected response type '{obj['type']}': {obj}")
+    assert line_count > 0, "Response should contain at least one line"
 
     # Validate we got meaningful content
-    assert has_text, "Response should contain text content"
+    assert text_chunks, "Response should contain text content"
 
     # Check that we got substantial text (not just citations)
     combined_text = "".join(text_chunks)
@@ -191,14 +203,14 @@ def test_session_isolation_between_users(test_client: TestClient):
     # User 1 asks about inflation
     request_1 = {
         "question": "What is the current inflation rate?",
-        "reality": reality_as_base64(),
+        "reality": REALITY_JSON,
         "session_id": session_1,
     }
 
     # User 2 asks about unemployment
     request_2 = {
         "question": "What is the unemployment rate?",
-        "reality": reality_as_base64(),
+        "reality": REALITY_JSON,
         "session_id": session_2,
     }
 
@@ -228,7 +240,7 @@ def test_session_isolation_between_users(test_client: TestClient):
     # (asking a follow-up that relies on context would work if thread persists)
     followup_request = {
         "question": "Can you elaborate on that unemployment figure?",
-        "reality": reality_as_base64(),
+        "reality": REALITY_JSON,
         "session_id": session_2,
     }
 
@@ -256,7 +268,7 @@ def test_same_session_maintains_thread(test_client: TestClient):
     # First question
     request_1 = {
         "question": "What is the SNB policy interest rate?",
-        "reality": reality_as_base64(),
+        "reality": REALITY_JSON,
         "session_id": session_id,
     }
 
@@ -267,7 +279,7 @@ def test_same_session_maintains_thread(test_client: TestClient):
     # Second question referencing the first
     request_2 = {
         "question": "How does that rate compare to historical averages?",
-        "reality": reality_as_base64(),
+        "reality": REALITY_JSON,
         "session_id": session_id,
     }
 
@@ -6,15 +6,18 @@ method, ensuring that exceptions are properly caught, formatted as error
 responses, and re-raised.
 """
 
-import json
-from collections.abc import AsyncIterator
-from unittest.mock import MagicMock, patch
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
+from pydantic_core import from_json, to_json
 
+from api.generate import GenerateRequest, generate
 from core.axiom_store import Axiom, AxiomId
 from core.qa_engine import (
     AxiomCitationContent,
+    CitationContent,
     TextContent,
     UserSessionId,
 )
@@ -31,10 +34,10 @@ def test_error_message_format():
     # Simulate what the stream() method does on error
     test_exception = Exception("Test error message")
     error_response = {"type": "error", "message": str(test_exception)}
-    error_json = json.dumps(error_response)
+    error_json = to_json(error_response)
 
     # Verify it's valid JSON
-    parsed = json.loads(error_json)
+    parsed = from_json(error_json)
     assert parsed["type"] == "error"
     assert parsed["message"] == "Test error message"
 
@@ -64,10 +67,10 @@ def test_error_response_format_for_various_exceptions(
 
     # Format as error response (simulating stream() error handling)
     error_response = {"type": "error", "message": str(exc)}
-    error_json = json.dumps(error_response)
+    error_json = to_json(error_response)
 
     # Verify the format
-    parsed = json.loads(error_json)
+    parsed = from_json(error_json)
     assert parsed["type"] == "error"
     assert parsed["message"] == exception_message
 
@@ -80,219 +83,125 @@ def test_ndjson_format_for_error_chunk():
     """
     error_response = {"type": "error", "message": "Test error"}
     # This is how the stream() method formats it
-    ndjson_line = f"{json.dumps(error_response)}\n"
+    ndjson_line = to_json(error_response) + b"\n"
 
     # Should end with newline
-    assert ndjson_line.endswith("\n")
+    assert ndjson_line.endswith(b"\n")
 
     # Should be parseable as JSON (minus the newline)
-    parsed = json.loads(ndjson_line.strip())
+    parsed = from_json(ndjson_line.strip())
     assert parsed["type"] == "error"
     assert parsed["message"] == "Test error"
 
 
-@pytest.mark.asyncio
-async def test_stream_yields_error_then_raises():
-    """
-    Integration test to verify the stream error handling flow.
-
-    This tests that:
-    1. The stream yields content chunks
-    2. When an exception occurs, an error chunk is yielded
-    3. The original exception is then re-raised
-    """
-    from api.generate import GenerateRequest
-
-    # Create a mock QA engine that yields content then fails
-    async def mock_streaming_with_error(
-        question: str,
-        session_id: UserSessionId,
-        reality: list[RealityStatement],
-    ) -> AsyncIterator[TextContent]:
-        yield TextContent(content="Partial response")
-        raise ValueError("Simulated error")
-
-    mock_engine = MagicMock()
-    mock_engine.invoke_streaming = mock_streaming_with_error
-
-    # Manually construct the stream() generator to test it
-    with patch("api.generate.qa_engine", return_value=mock_engine):
-        # Import here to get the patched version
-        from api.generate import generate
-
-        request = GenerateRequest(
-            question="Test question",
-            reality=None,
-            session_id="test-session",
-        )
-
-        # Get the streaming response
-        response = await generate(request)
-
-        # Collect all chunks (including error)
-        chunks: list[str] = []
-        exception_raised = False
-        try:
-            async for chunk in response.body_iterator:
-                chunks.append(
-                    chunk
-                    if isinstance(chunk, str)
-                    else chunk.decode(  # type: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
-                        "utf-8"
-                    )
-                )
-        except ValueError as e:
-            # Exception should be re-raised
-            assert str(e) == "Simulated error"
-            exception_raised = True
-
-        # Verify exception was raised
-        assert exception_raised, "Expected ValueError to be re-raised"
-
-        # Should have yielded at least 2 chunks: content + error
-        assert len(chunks) >= 2, (
-            f"Expected at least 2 chunks, got {len(chunks)}"
-        )
-
-        # Parse first chunk (content)
-        first_chunk = json.loads(chunks[0].strip())
-        assert first_chunk["type"] == "text"
-        assert first_chunk["text"] == "Partial response"
-
-        # Parse second chunk (error)
-        error_chunk = json.loads(chunks[1].strip())
-        assert error_chunk["type"] == "error"
-        assert "Simulated error" in error_chunk["message"]
-
-
-@pytest.mark.asyncio
-async def test_stream_with_mixed_content_before_error():
+async def stream_text_then_error(
+    question: str,
+    session_id: UserSessionId,
+    reality: list[RealityStatement],
+) -> AsyncIterator[TextContent]:
+    """Yield content, then fail."""
+    yield TextContent(content="Partial response")
+    raise ValueError("Simulated error")
+
+
+async def stream_mixed_content_then_error(
+    question: str,
+    session_id: UserSessionId,
+    reality: list[RealityStatement],
+) -> AsyncIterator[TextContent | AxiomCitationContent]:
+    """Yield text and a citation, then fail."""
+    yield TextContent(content="Start")
+    yield AxiomCitationContent(
+        item=Axiom(id=AxiomId("A-001"), description="Test axiom")
+    )
+    yield TextContent(content=" middle")
+    raise ConnectionError("Connection lost")
+
+
+async def stream_immediate_error(
+    question: str,
+    session_id: UserSessionId,
+    reality: list[RealityStatement],
+) -> AsyncIterator[TextContent]:
+    """Fail before any content is yielded."""
+    raise RuntimeError("Immediate error")
+    # This yield is unreachable but makes the function a generator
+    yield TextContent(content="Never reached")  # type: ignore[unreachable]
+
+
+@pytest.fixture
+def mock_engine(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the QA engine used by /api/generate with a plain fake.
+
+    Only invoke_streaming is used and no calls are asserted, so a
+    namespace is enough; tests set invoke_streaming to their streamer.
     """
-    Test error handling when stream has yielded multiple content types.
-
-    Verifies that error handling works correctly even after yielding
-    text content and citations.
-    """
-    from api.generate import GenerateRequest
-
-    # Create a mock QA engine that yields mixed content then fails
-    async def mock_streaming_mixed_then_error(
-        question: str,
-        session_id: UserSessionId,
-        reality: list[RealityStatement],
-    ) -> AsyncIterator[TextContent | AxiomCitationContent]:
-        yield TextContent(content="Start")
-        yield AxiomCitationContent(
-            item=Axiom(id=AxiomId("A-001"), description="Test axiom")
-        )
-        yield TextContent(content=" middle")
-        raise ConnectionError("Connection lost")
-
-    mock_engine = MagicMock()
-    mock_engine.invoke_streaming = mock_streaming_mixed_then_error
-
-    with patch("api.generate.qa_engine", return_value=mock_engine):
-        from api.generate import generate
-
-        request = GenerateRequest(
-            question="Test question",
-            reality=None,
-            session_id="test-session",
-        )
-
-        response = await generate(request)
-
-        chunks: list[str] = []
-        exception_raised = False
-        try:
-            async for chunk in response.body_iterator:
-                chunks.append(
-                    chunk
-                    if isinstance(chunk, str)
-                    else chunk.decode(  # type: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
-                        "utf-8"
-                    )
-                )
-        except ConnectionError:
-            exception_raised = True
-
-        # Should have raised the exception
-        assert exception_raised, "Expected ConnectionError to be re-raised"
-
-        # Should have multiple chunks before error
-        assert len(chunks) >= 4, "Expected 3 content chunks + error chunk"
-
-        # Verify we got the expected content types
-        chunk_types = []
-        for chunk_data in chunks:
-            if chunk_data.strip():
-                parsed = json.loads(chunk_data.strip())
-                chunk_types.append(  # type: ignore[reportUnknownMemberType]
-                    parsed["type"]
-                )
-
-        # Should have text, axiom citation, more text, and error
-        assert "text" in chunk_types
-        assert "axiom_citation" in chunk_types
-        assert "error" in chunk_types
+    engine = SimpleNamespace(invoke_streaming=None)
+    monkeypatch.setattr("api.generate.qa_engine", lambda: engine)
+    return engine
 
 
 @pytest.mark.asyncio
-async def test_stream_immediate_error():
+@pytest.mark.parametrize(
+    "streamer,exception,expected_types,expected_text",
+    [
+        pytest.param(
+            stream_text_then_error,
+            ValueError("Simulated error"),
+            ["text", "error"],
+            "Partial response",
+            id="Content then error",
+        ),
+        pytest.param(
+            stream_mixed_content_then_error,
+            ConnectionError("Connection lost"),
+            ["text", "axiom_citation", "text", "error"],
+            "Start middle",
+            id="Mixed content then error",
+        ),
+        pytest.param(
+            stream_immediate_error,
+            RuntimeError("Immediate error"),
+            ["error"],
+            "",
+            id="Immediate error",
+        ),
+    ],
+)
+async def test_stream_yields_error_then_raises(
+    mock_engine: SimpleNamespace,
+    streamer: Callable[..., AsyncIterator[TextContent | CitationContent]],
+    exception: Exception,
+    expected_types: list[str],
+    expected_text: str,
+):
     """
-    Test error handling when exception occurs immediately.
+    Verify the stream error handling flow.
 
-    Verifies that errors raised before any content is yielded are
-    still properly formatted and re-raised.
+    This tests that:
+    1. The stream yields the content chunks produced before the failure
+    2. When an exception occurs, an error chunk is yielded
+    3. The original exception is then re-raised
     """
-    from api.generate import GenerateRequest
-
-    # Create a mock QA engine that fails immediately
-    async def mock_streaming_immediate_error(
-        question: str,
-        session_id: UserSessionId,
-        reality: list[RealityStatement],
-    ) -> AsyncIterator[TextContent]:
-        raise RuntimeError("Immediate error")
-        # This yield is unreachable but makes the function a generator
-        yield TextContent(content="Never reached")  # type: ignore[unreachable]
-
-    mock_engine = MagicMock()
-    mock_engine.invoke_streaming = mock_streaming_immediate_error
-
-    with patch("api.generate.qa_engine", return_value=mock_engine):
-        from api.generate import generate
-
-        request = GenerateRequest(
-            question="Test question",
-            reality=None,
-            session_id="test-session",
-        )
-
-        response = await generate(request)
-
-        chunks: list[str] = []
-        exception_raised = False
-        try:
-            async for chunk in response.body_iterator:
-                chunks.append(
-                    chunk
-                    if isinstance(chunk, str)
-                    else chunk.decode(  # type: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
-                        "utf-8"
-                    )
-                )
-        except RuntimeError as e:
-            assert str(e) == "Immediate error"
-            exception_raised = True
-
-        # Verify exception was raised
-        assert exception_raised, "Expected RuntimeError to be re-raised"
-
-        # Should have yielded at least the error chunk
-        assert len(chunks) >= 1, "Expected at least error chunk"
-
-        # Parse error chunk
-        error_chunk = json.loads(chunks[0].strip())
-        assert error_chunk["type"] == "error"
-        assert "Immediate error" in error_chunk["message"]
+    mock_engine.invoke_streaming = streamer
+    request = GenerateRequest(
+        question="Test question",
+        reality=None,
+        session_id="test-session",
+    )
+
+    response = await generate(request)
+
+    chunks: list[dict[str, Any]] = []
+    with pytest.raises(type(exception), match=str(exception)):
+        async for chunk in response.body_iterator:
+            # stream() yields UTF-8 encoded NDJSON lines
+            assert isinstance(chunk, bytes)
+            chunks.append(from_json(chunk))
+
+    assert [chunk["type"] for chunk in chunks] == expected_types
+    text = "".join(
+        chunk["text"] for chunk in chunks if chunk["type"] == "text"
+    )
+    assert text == expected_text
+    assert chunks[-1]["message"] == str(exception)
@@ -1,9 +1,13 @@
 """Root conftest.py for loading environment variables from .env file."""
 
+import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+# Records the mtime of the .env file already loaded into the environment
+DOTENV_LOADED_ENV_VAR = "_DOTENV_LOADED"
+
 
 def pytest_configure():
     """Load environment variables from .env file before running tests."""
@@ -11,5 +15,15 @@ def pytest_configure():
     project_root = Path(__file__).parent.parent
     env_file = project_root / ".env"
 
-    if env_file.exists():
-        _ = load_dotenv(env_file)
+    try:
+        mtime = str(env_file.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return
+
+    # Worker processes (e.g. pytest-xdist) inherit the environment, so an
+    # unchanged .env file is only parsed once per run
+    if os.environ.get(DOTENV_LOADED_ENV_VAR) == mtime:
+        return
+
+    _ = load_dotenv(env_file)
+    os.environ[DOTENV_LOADED_ENV_VAR] = mtime
@@ -0,0 +1,9 @@
+import pytest
+
+from core.axiom_store import Axiom, AxiomId, AxiomStore
+
+
+@pytest.fixture(scope="session")
+def single_axiom_store() -> AxiomStore:
+    # AxiomStore is immutable, so every test can share the same instance.
+    return AxiomStore([Axiom(id=AxiomId("A-001"), description="description")])
@@ -5,6 +5,7 @@ This module tests the dependency injection functions and caching behavior
 for the QA Engine components.
 """
 
+from typing import Protocol
 from unittest.mock import Mock, patch
 
 import pytest
@@ -18,6 +19,15 @@ from core.dependencies import (
 )
 
 
+class CachedDependency(Protocol):
+    """A dependency function wrapped with functools.cache."""
+
+    def __call__(self) -> object: ...
+
+    # functools' CacheInfo: hits, misses, maxsize, currsize
+    def cache_info(self) -> tuple[int, int, int | None, int]: ...
+
+
 @pytest.fixture(autouse=True)
 def patch_azure_cli_credential():
     """Mock AzureCliCredential to avoid actual authentication."""
@@ -67,19 +77,6 @@ def test_credential_returns_azure_cli_credential():
     assert result is not None
 
 
-def test_credential_caches_result():
-    """
-    Test that credential() caches its result and doesn't create
-    multiple instances for performance and consistency reasons.
-    """
-    # act
-    result1 = credential()
-    result2 = credential()
-
-    # assert
-    assert result1 is result2
-
-
 def test_azure_chat_openai_creates_client():
     """Test that azure_chat_openai() creates an Azure OpenAI client."""
     # act
@@ -89,16 +86,6 @@ def test_azure_chat_openai_creates_client():
     assert result is not None
 
 
-def test_azure_chat_openai_caches_result():
-    """Test that azure_chat_openai() caches its result."""
-    # act
-    result1 = azure_chat_openai()
-    result2 = azure_chat_openai()
-
-    # assert
-    assert result1 is result2
-
-
 def test_chat_agent_creates_agent_with_system_prompt():
     """Test that chat_agent() creates an agent with the system prompt."""
     # act
@@ -108,16 +95,6 @@ def test_chat_agent_creates_agent_with_system_prompt():
     assert result is not None
 
 
-def test_chat_agent_caches_result():
-    """Test that chat_agent() caches its result."""
-    # act
-    result1 = chat_agent()
-    result2 = chat_agent()
-
-    # assert
-    assert result1 is result2
-
-
 def test_axiom_store_loads_from_json(mock_load_from_json: Mock):
     """Test that axiom_store() loads data from JSON file."""
     # act
@@ -131,18 +108,6 @@ def test_axiom_store_loads_from_json(mock_load_from_json: Mock):
     assert result is not None
 
 
-def test_axiom_store_caches_result(mock_load_from_json: Mock):
-    """Test that axiom_store() caches its result."""
-
-    # act
-    result1 = axiom_store()
-    result2 = axiom_store()
-
-    # assert
-    mock_load_from_json.assert_called_once()
-    assert result1 is result2
-
-
 def test_qa_engine_creates_engine_with_dependencies(mock_load_from_json: Mock):
     """Test that qa_engine() creates a QAEngine with agent and axiom_store."""
 
@@ -154,11 +119,25 @@ def test_qa_engine_creates_engine_with_dependencies(mock_load_from_json: Mock):
     mock_load_from_json.assert_called_once()
 
 
-def test_qa_engine_caches_result(mock_load_from_json: Mock):
-    """Test that qa_engine() caches its result."""
+@pytest.mark.parametrize(
+    "dependency",
+    [credential, azure_chat_openai, chat_agent, axiom_store, qa_engine],
+    ids=lambda dependency: dependency.__name__,
+)
+def test_dependency_caches_result(
+    dependency: CachedDependency, mock_load_from_json: Mock
+):
+    """
+    Test that each dependency caches its result and doesn't create
+    multiple instances for performance and consistency reasons.
+    """
     # act
-    result1 = qa_engine()
-    result2 = qa_engine()
+    result1 = dependency()
+    result2 = dependency()
+
     # assert
-    mock_load_from_json.assert_called_once()
+    # The patched constructors return the same mock on every call, so the
+    # identity check alone can't tell a cached result from a rebuilt one
     assert result1 is result2
+    hits, misses, _, _ = dependency.cache_info()
+    assert (hits, misses) == (1, 1)
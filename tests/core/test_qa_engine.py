@@ -11,7 +11,9 @@ from unittest.mock import MagicMock
 
 import pytest
 from agent_framework import AgentThread, ChatAgent
+from jinja2 import Template
 
+from core import prompt
 from core.axiom_store import Axiom, AxiomId, AxiomStore
 from core.qa_engine import (
     AxiomCitationContent,
@@ -37,11 +39,27 @@ async def async_iter[T](iterable: Iterable[T]) -> AsyncIterator[T]:
 class MockStreamChunk:
     """Mock class for agent stream chunks."""
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str):
         super().__init__()
         self.text = text
 
 
+def make_mock_stream(
+    chunks: Iterable[str],
+) -> Callable[..., AsyncIterator[MockStreamChunk]]:
+    """Create a run_stream replacement that yields the given text chunks."""
+    stream_chunks = [MockStreamChunk(chunk) for chunk in chunks]
+
+    def mock_run_stream(
+        _prompt: str, **_kwargs: object
+    ) -> AsyncIterator[MockStreamChunk]:
+        return async_iter(stream_chunks)
+
+    return mock_run_stream
+
+
 def create_mock_agent_with_thread() -> MagicMock:
     """Create a mock ChatAgent with a mock thread."""
     mock_agent = MagicMock(spec=ChatAgent)
@@ -51,33 +69,18 @@ def create_mock_agent_with_thread() -> MagicMock:
 
 
 @pytest.mark.asyncio
-async def test_invoke_stream_calls_agent_correctly():
+async def test_invoke_stream_calls_agent_correctly(
+    single_axiom_store: AxiomStore,
+):
     """Test that invoke_streaming correctly
     calls the agent's run_stream method."""
     # Arrange
     mock_agent = create_mock_agent_with_thread()
 
     # Mock run_stream to return chunks
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        yield MockStreamChunk("Hello")
-        yield MockStreamChunk(", ")
-        yield MockStreamChunk("world")
-        yield MockStreamChunk("!")
-
-    mock_agent.run_stream = mock_run_stream
-
-    axiom_store = AxiomStore(
-        [
-            Axiom(
-                id=AxiomId("A-001"),
-                description="description",
-            )
-        ]
-    )
+    mock_agent.run_stream = make_mock_stream(["Hello", ", ", "world", "!"])
 
-    subject = QAEngine(mock_agent, axiom_store)
+    subject = QAEngine(mock_agent, single_axiom_store)
 
     # Act
     result: list[TextContent | CitationContent] = []
@@ -97,16 +100,13 @@ async def test_invoke_stream_calls_agent_correctly():
 
 async def act_invoke_stream(qa_engine: QAEngine) -> str:
     """Helper to collect all text from streaming invoke."""
-    result = ""
+    parts: list[str] = []
     async for chunk in qa_engine.invoke_streaming(
         question="Test question", session_id=TEST_SESSION_ID
     ):
-        if isinstance(chunk, TextContent):
-            result += chunk.content
-        else:
-            # chunk is AxiomCitationContent or RealityCitationContent
-            result += chunk.content
-    return result
+        # Text and citation chunks all expose their text as content
+        parts.append(chunk.content)
+    return "".join(parts)
 
 
 async def act_invoke(qa_engine: QAEngine) -> str:
@@ -136,13 +136,7 @@ async def test_invoke_returns_correct_message(
     mock_agent = create_mock_agent_with_thread()
 
     # Mock run_stream to return chunks that form "Hello, world!"
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        for content in ["Hello", ", ", "world", "!"]:
-            yield MockStreamChunk(content)
-
-    mock_agent.run_stream = mock_run_stream
+    mock_agent.run_stream = make_mock_stream(["Hello", ", ", "world", "!"])
 
     qa_engine = QAEngine(mock_agent, MagicMock(spec=AxiomStore))
 
@@ -193,6 +187,49 @@ async def test_formatted_prompt_includes_constitution():
     assert "Test question?" in captured_prompt
 
 
+@pytest.mark.asyncio
+async def test_constitution_rendered_once_per_axiom_store(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the constitution is reused across questions."""
+    # Arrange
+    mock_agent = create_mock_agent_with_thread()
+    captured_prompts: list[str] = []
+
+    async def mock_run_stream(
+        _prompt: str, **_kwargs: object
+    ) -> AsyncIterator[MockStreamChunk]:
+        captured_prompts.append(_prompt)
+        yield MockStreamChunk("Test response")
+
+    mock_agent.run_stream = mock_run_stream
+
+    loaded_templates: list[str] = []
+    load_template = prompt._load_template  # pyright: ignore[reportPrivateUsage]
+
+    def counting_load_template(file: str) -> Template:
+        loaded_templates.append(file)
+        return load_template(file)
+
+    monkeypatch.setattr(prompt, "_load_template", counting_load_template)
+
+    axiom_store = AxiomStore(
+        [Axiom(id=AxiomId("A-001"), description="Test Description")]
+    )
+    qa_engine = QAEngine(mock_agent, axiom_store)
+
+    # Act
+    for question in ("First question?", "Second question?"):
+        async for _ in qa_engine.invoke_streaming(question, TEST_SESSION_ID):
+            pass
+
+    # Assert
+    assert loaded_templates.count("constitution.j2") == 1
+    assert len(captured_prompts) == 2
+    assert all("Test Description" in p for p in captured_prompts)
+    assert "Second question?" in captured_prompts[1]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "chunks_from_agent, expected_output",
@@ -248,31 +285,16 @@ async def test_formatted_prompt_includes_constitution():
 async def test_invoke_streaming_citation_handling(
     chunks_from_agent: list[str],
     expected_output: list[TextContent | CitationContent],
+    single_axiom_store: AxiomStore,
 ):
     """Test that invoke_streaming correctly handles citations."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
 
     # Mock the run_stream method to return MockStreamChunk objects
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        for chunk_content in chunks_from_agent:
-            yield MockStreamChunk(chunk_content)
-
-    mock_agent.run_stream = mock_run_stream
-
-    # Create axiom store with one test axiom
-    axiom_store = AxiomStore(
-        [
-            Axiom(
-                id=AxiomId("A-001"),
-                description="description",
-            )
-        ]
-    )
+    mock_agent.run_stream = make_mock_stream(chunks_from_agent)
 
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act
     result: list[TextContent | CitationContent] = []
@@ -334,12 +356,7 @@ async def test_invoke_streaming_multiple_citations_in_sequence():
     # Arrange
     mock_agent = create_mock_agent_with_thread()
 
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        yield MockStreamChunk("[A-001][A-002]")
-
-    mock_agent.run_stream = mock_run_stream
+    mock_agent.run_stream = make_mock_stream(["[A-001][A-002]"])
 
     # Create axiom store with two test axioms
     axiom_store = AxiomStore(
@@ -365,9 +382,8 @@ async def test_invoke_streaming_multiple_citations_in_sequence():
         result.append(chunk)
 
     # Assert
-    # Should have: empty text, citation 1, empty text, citation 2
-    # (Empty texts result from the regex processing)
-    assert len(result) == 4
+    # Should have only the two citations, without empty text in between
+    assert len(result) == 2
     citation_chunks = [
         c for c in result if isinstance(c, AxiomCitationContent)
     ]
@@ -377,30 +393,18 @@ async def test_invoke_streaming_multiple_citations_in_sequence():
 
 
 @pytest.mark.asyncio
-async def test_invoke_collects_all_streaming_chunks():
+async def test_invoke_collects_all_streaming_chunks(
+    single_axiom_store: AxiomStore,
+):
     """Test that invoke method correctly collects all streaming chunks."""
     # Arrange
     mock_agent = create_mock_agent_with_thread()
 
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        chunks = ["This ", "is ", "a ", "test ", "[A-001]"]
-        for chunk in chunks:
-            yield MockStreamChunk(chunk)
-
-    mock_agent.run_stream = mock_run_stream
-
-    axiom_store = AxiomStore(
-        [
-            Axiom(
-                id=AxiomId("A-001"),
-                description="description",
-            )
-        ]
+    mock_agent.run_stream = make_mock_stream(
+        ["This ", "is ", "a ", "test ", "[A-001]"]
     )
 
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act
     result = await qa_engine.invoke(
@@ -572,6 +576,15 @@ def test_axiom_store_integration():
             [],
             id="valid citation mixed with non-citation brackets",
         ),
+        pytest.param(
+            ["Text with [random brackets] and [A", "-001]."],
+            "Text with [random brackets] and [A-001].",
+            1,
+            0,
+            ["A-001"],
+            [],
+            id="split citation after non-citation brackets",
+        ),
         pytest.param(
             ["Valid [A-001] and incomplete [AX"],
             "Valid [A-001] and incomplete [AX",
@@ -640,13 +653,7 @@ async def test_invoke_streaming_handles_chunk_scenarios(
     # Arrange
     mock_agent = create_mock_agent_with_thread()
 
-    async def mock_run_stream(
-        _prompt: str, **_kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        for chunk in agent_chunks:
-            yield MockStreamChunk(chunk)
-
-    mock_agent.run_stream = mock_run_stream
+    mock_agent.run_stream = make_mock_stream(agent_chunks)
 
     # Create axiom store with test axioms for citation tests
     axiom_store = AxiomStore(
@@ -686,6 +693,7 @@ async def test_invoke_streaming_handles_chunk_scenarios(
     # Assert
     full_text = "".join(chunk.content for chunk in result)
     assert full_text == expected_text
+    assert all(chunk.content for chunk in result)
 
     # Verify citation counts
     axiom_citations = [
@@ -711,19 +719,17 @@ async def test_invoke_streaming_handles_chunk_scenarios(
 # =============================================================================
 
 
-def test_qa_engine_creates_thread_on_first_access():
+def test_qa_engine_creates_thread_on_first_access(
+    single_axiom_store: AxiomStore,
+):
     """Test that QAEngine creates a new thread when first accessed."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
     mock_thread = MagicMock(spec=AgentThread)
     mock_agent.get_new_thread.return_value = mock_thread
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-
     # Act
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
     thread = qa_engine.get_thread(TEST_SESSION_ID)
 
     # Assert
@@ -731,16 +737,13 @@ def test_qa_engine_creates_thread_on_first_access():
     assert thread is mock_thread
 
 
-def test_qa_engine_thread_is_accessible():
+def test_qa_engine_thread_is_accessible(single_axiom_store: AxiomStore):
     """Test that the thread is accessible via get_thread after creation."""
     # Arrange
     mock_agent = create_mock_agent_with_thread()
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
 
     # Act
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
     thread = qa_engine.get_thread(TEST_SESSION_ID)
 
     # Assert
@@ -749,7 +752,9 @@ def test_qa_engine_thread_is_accessible():
 
 
 @pytest.mark.asyncio
-async def test_qa_engine_uses_thread_for_streaming():
+async def test_qa_engine_uses_thread_for_streaming(
+    single_axiom_store: AxiomStore,
+):
     """Test that invoke_streaming uses the thread created for the session."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -765,10 +770,7 @@ async def test_qa_engine_uses_thread_for_streaming():
 
     mock_agent.run_stream = mock_run_stream
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act
     async for _ in qa_engine.invoke_streaming(
@@ -782,7 +784,9 @@ async def test_qa_engine_uses_thread_for_streaming():
 
 
 @pytest.mark.asyncio
-async def test_qa_engine_uses_thread_for_invoke():
+async def test_qa_engine_uses_thread_for_invoke(
+    single_axiom_store: AxiomStore,
+):
     """Test that invoke uses the thread created for the session."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -798,10 +802,7 @@ async def test_qa_engine_uses_thread_for_invoke():
 
     mock_agent.run_stream = mock_run_stream
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act
     _ = await qa_engine.invoke(question="Test?", session_id=TEST_SESSION_ID)
@@ -811,7 +812,9 @@ async def test_qa_engine_uses_thread_for_invoke():
     assert captured_kwargs["thread"] is mock_thread
 
 
-def test_different_sessions_get_separate_threads():
+def test_different_sessions_get_separate_threads(
+    single_axiom_store: AxiomStore,
+):
     """Test that different session IDs get separate threads."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -819,12 +822,8 @@ def test_different_sessions_get_separate_threads():
     mock_thread_2 = MagicMock(spec=AgentThread)
     mock_agent.get_new_thread.side_effect = [mock_thread_1, mock_thread_2]
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-
     # Act
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
     session_1 = UserSessionId("session-1")
     session_2 = UserSessionId("session-2")
     thread_1 = qa_engine.get_thread(session_1)
@@ -837,19 +836,15 @@ def test_different_sessions_get_separate_threads():
     assert mock_agent.get_new_thread.call_count == 2
 
 
-def test_same_session_gets_same_thread():
+def test_same_session_gets_same_thread(single_axiom_store: AxiomStore):
     """Test that the same session ID always returns the same thread."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
     mock_thread = MagicMock(spec=AgentThread)
     mock_agent.get_new_thread.return_value = mock_thread
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-
     # Act
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
     thread_1 = qa_engine.get_thread(TEST_SESSION_ID)
     thread_2 = qa_engine.get_thread(TEST_SESSION_ID)
 
@@ -859,7 +854,9 @@ def test_same_session_gets_same_thread():
 
 
 @pytest.mark.asyncio
-async def test_invoke_streaming_twice_passes_same_thread_with_store_true():
+async def test_invoke_streaming_twice_passes_same_thread_with_store_true(
+    single_axiom_store: AxiomStore,
+):
     """Test invoke_streaming twice uses same thread with store=True.
 
     This ensures conversation history is maintained across multiple calls.
@@ -882,10 +879,7 @@ async def test_invoke_streaming_twice_passes_same_thread_with_store_true():
 
     mock_agent.run_stream = mock_run_stream
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act - call invoke_streaming twice with same session
     async for _ in qa_engine.invoke_streaming(
@@ -916,7 +910,7 @@ async def test_invoke_streaming_twice_passes_same_thread_with_store_true():
 
 
 @pytest.mark.asyncio
-async def test_reset_thread_creates_new_thread():
+async def test_reset_thread_creates_new_thread(single_axiom_store: AxiomStore):
     """Test that reset_thread creates a new thread instance for the session."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -924,10 +918,7 @@ async def test_reset_thread_creates_new_thread():
     mock_thread_2 = MagicMock(spec=AgentThread)
     mock_agent.get_new_thread.side_effect = [mock_thread_1, mock_thread_2]
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Verify initial thread
     initial_thread = qa_engine.get_thread(TEST_SESSION_ID)
@@ -944,7 +935,9 @@ async def test_reset_thread_creates_new_thread():
 
 
 @pytest.mark.asyncio
-async def test_reset_thread_clears_conversation_history():
+async def test_reset_thread_clears_conversation_history(
+    single_axiom_store: AxiomStore,
+):
     """Test that reset_thread clears conversation by using new thread."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -962,10 +955,7 @@ async def test_reset_thread_clears_conversation_history():
 
     mock_agent.run_stream = mock_run_stream
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act - invoke, reset, then invoke again
     async for _ in qa_engine.invoke_streaming(
@@ -988,7 +978,9 @@ async def test_reset_thread_clears_conversation_history():
 
 
 @pytest.mark.asyncio
-async def test_reset_thread_allows_fresh_conversation():
+async def test_reset_thread_allows_fresh_conversation(
+    single_axiom_store: AxiomStore,
+):
     """Test that after reset_thread, new invocations use a fresh thread."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -1001,17 +993,9 @@ async def test_reset_thread_allows_fresh_conversation():
 
     mock_agent.get_new_thread.side_effect = create_mock_thread
 
-    async def mock_run_stream(
-        _prompt: str, **kwargs: object
-    ) -> AsyncIterator[MockStreamChunk]:
-        yield MockStreamChunk("Response")
+    mock_agent.run_stream = make_mock_stream(["Response"])
 
-    mock_agent.run_stream = mock_run_stream
-
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Access thread first, then reset twice
     _ = qa_engine.get_thread(TEST_SESSION_ID)
@@ -1026,7 +1010,9 @@ async def test_reset_thread_allows_fresh_conversation():
 
 
 @pytest.mark.asyncio
-async def test_reset_thread_only_affects_specified_session():
+async def test_reset_thread_only_affects_specified_session(
+    single_axiom_store: AxiomStore,
+):
     """Test that reset_thread only affects the specified session."""
     # Arrange
     mock_agent = MagicMock(spec=ChatAgent)
@@ -1039,10 +1025,7 @@ async def test_reset_thread_only_affects_specified_session():
 
     mock_agent.get_new_thread.side_effect = create_mock_thread
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     session_1 = UserSessionId("session-1")
     session_2 = UserSessionId("session-2")
@@ -1065,7 +1048,9 @@ async def test_reset_thread_only_affects_specified_session():
 
 
 @pytest.mark.asyncio
-async def test_invoke_twice_passes_same_thread_with_store_true():
+async def test_invoke_twice_passes_same_thread_with_store_true(
+    single_axiom_store: AxiomStore,
+):
     """Test that calling invoke twice uses the same thread with store=True.
 
     This ensures conversation history is maintained across multiple calls.
@@ -1088,10 +1073,7 @@ async def test_invoke_twice_passes_same_thread_with_store_true():
 
     mock_agent.run_stream = mock_run_stream
 
-    axiom_store = AxiomStore(
-        [Axiom(id=AxiomId("A-001"), description="description")]
-    )
-    qa_engine = QAEngine(mock_agent, axiom_store)
+    qa_engine = QAEngine(mock_agent, single_axiom_store)
 
     # Act - call invoke twice with same session
     _ = await qa_engine.invoke(
@@ -17,23 +17,22 @@ import pytest
 from pydantic import ValidationError
 
 from eval.eval import (
-    calculate_stats,
     load_axiom_definitions,
     load_reality_definitions,
 )
 from eval.models import (
     AccuracyEvaluationResults,
     AxiomItem,
-    AxiomReferenceResults,
     Entity,
     EntityAccuracy,
     EntityExtraction,
     EvaluationSampleInput,
     EvaluationSampleOutput,
     RealityItem,
-    RealityReferenceResults,
+    ReferenceResults,
     TopicCoverageEvaluationResults,
 )
+from eval.stats import calculate_stats
 
 # =============================================================================
 # Type Aliases
@@ -113,13 +112,13 @@ def sample_output() -> EvaluationSampleOutput:
             reason="Coverage reason",
             coverage_score=0.9,
         ),
-        axiom_references=AxiomReferenceResults(
+        axiom_references=ReferenceResults(
             references_found=["A-001"],
             references_expected=["A-001"],
             precision=1.0,
             recall=1.0,
         ),
-        reality_references=RealityReferenceResults(
+        reality_references=ReferenceResults(
             references_found=["R-001"],
             references_expected=["R-001"],
             precision=1.0,
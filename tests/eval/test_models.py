@@ -13,15 +13,12 @@ import pytest
 from pydantic import BaseModel, ValidationError
 
 from eval.models import (
-    AccuracyMetric,
+    EVAL_ADAPTER,
     AxiomItem,
-    AxiomPrecisionMetric,
-    AxiomRecallMetric,
-    CoverageMetric,
+    Entity,
     EvaluationResult,
+    Metric,
     RealityItem,
-    RealityPrecisionMetric,
-    RealityRecallMetric,
 )
 
 # =============================================================================
@@ -189,12 +186,12 @@ def minimal_evaluation_result() -> EvaluationResult:
     """Fixture providing a minimal EvaluationResult for testing."""
     return EvaluationResult(
         evaluation_outputs=[],
-        accuracy=AccuracyMetric(mean=0.8, std=0.1),
-        topic_coverage=CoverageMetric(mean=0.85, std=0.05),
-        axiom_precision_metric=AxiomPrecisionMetric(mean=0.9, std=0.1),
-        axiom_recall_metric=AxiomRecallMetric(mean=0.8, std=0.15),
-        reality_precision_metric=RealityPrecisionMetric(mean=0.85, std=0.1),
-        reality_recall_metric=RealityRecallMetric(mean=0.75, std=0.2),
+        accuracy=Metric(mean=0.8, std=0.1),
+        topic_coverage=Metric(mean=0.85, std=0.05),
+        axiom_precision_metric=Metric(mean=0.9, std=0.1),
+        axiom_recall_metric=Metric(mean=0.8, std=0.15),
+        reality_precision_metric=Metric(mean=0.85, std=0.1),
+        reality_recall_metric=Metric(mean=0.75, std=0.2),
     )
 
 
@@ -339,3 +336,35 @@ def test_evaluation_result_excludes_none_definitions_in_json(
 
     assert "axiom_definitions" not in data
     assert "reality_definitions" not in data
+
+
+def test_eval_adapter_validate_json_roundtrip(
+    minimal_evaluation_result: EvaluationResult,
+) -> None:
+    """Test the prebuilt adapter validates a single JSON document."""
+    json_bytes = EVAL_ADAPTER.dump_json(minimal_evaluation_result)
+    restored = EVAL_ADAPTER.validate_json(json_bytes)
+
+    assert restored == minimal_evaluation_result
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Entity(trigger_variable="a", consequence_variable="b"),
+        Metric(mean=0.5, std=0.1),
+    ],
+    ids=["entity", "metric"],
+)
+def test_hot_models_are_frozen(instance: BaseModel) -> None:
+    """Test that frequently created models reject attribute assignment."""
+    field_name = next(iter(type(instance).model_fields))
+
+    with pytest.raises(ValidationError):
+        setattr(instance, field_name, "changed")
+
+
+def test_hot_models_forbid_extra_fields() -> None:
+    """Test that frequently created models reject unknown fields."""
+    with pytest.raises(ValidationError):
+        _ = Metric.model_validate({"mean": 0.5, "std": 0.1, "x": 1})
@@ -23,19 +23,13 @@ from eval.eval import (
     REALITY_REFERENCE_PATTERN as REALITY_PATTERN,
 )
 from eval.eval import (
-    calculate_mean_std,
     calculate_precision_recall,
     evaluate_axiom_references,
     evaluate_reality_references,
 )
 from eval.models import (
-    AxiomPrecisionMetric,
-    AxiomRecallMetric,
-    AxiomReferenceResults,
     AxiomReferences,
-    RealityPrecisionMetric,
-    RealityRecallMetric,
-    RealityReferenceResults,
+    Metric,
     RealityReferences,
     ReferenceResults,
 )
@@ -194,8 +188,8 @@ def test_mixed_axiom_and_reality_extraction() -> None:
 
 
 def test_create_valid_axiom_results() -> None:
-    """Create a valid AxiomReferenceResults instance."""
-    result = AxiomReferenceResults(
+    """Create a valid ReferenceResults instance for axioms."""
+    result = ReferenceResults(
         references_found=["A-001", "A-002"],
         references_expected=["A-001", "A-003"],
         precision=0.5,
@@ -208,8 +202,8 @@ def test_create_valid_axiom_results() -> None:
 
 
 def test_create_valid_reality_results() -> None:
-    """Create a valid RealityReferenceResults instance."""
-    result = RealityReferenceResults(
+    """Create a valid ReferenceResults instance for reality facts."""
+    result = ReferenceResults(
         references_found=["R-001"],
         references_expected=["R-001", "R-002"],
         precision=1.0,
@@ -248,12 +242,12 @@ def test_reference_results_validation_bounds(
     }
     kwargs[field] = invalid_value
     with pytest.raises(ValidationError):
-        _ = AxiomReferenceResults(**kwargs)
+        _ = ReferenceResults(**kwargs)
 
 
 def test_empty_references() -> None:
     """Create results with empty reference lists."""
-    result = AxiomReferenceResults(
+    result = ReferenceResults(
         references_found=[],
         references_expected=[],
         precision=1.0,
@@ -263,28 +257,6 @@ def test_empty_references() -> None:
     assert result.references_expected == []
 
 
-def test_reference_results_inheritance() -> None:
-    """Both AxiomReferenceResults and RealityReferenceResults
-    inherit from ReferenceResults."""
-    axiom_result = AxiomReferenceResults(
-        references_found=[],
-        references_expected=[],
-        precision=0.0,
-        recall=0.0,
-    )
-    reality_result = RealityReferenceResults(
-        references_found=[],
-        references_expected=[],
-        precision=0.0,
-        recall=0.0,
-    )
-    assert isinstance(axiom_result, ReferenceResults)
-    assert isinstance(reality_result, ReferenceResults)
-    # Ensure they are not related to each other
-    assert not isinstance(axiom_result, RealityReferenceResults)
-    assert not isinstance(reality_result, AxiomReferenceResults)
-
-
 # =============================================================================
 # Tests for Reference Evaluation Functions
 # =============================================================================
@@ -355,12 +327,12 @@ def test_axiom_evaluation_removes_duplicates() -> None:
 
 
 @pytest.mark.parametrize(
-    ("metric_class", "mean", "std"),
+    ("mean", "std"),
     [
-        (AxiomPrecisionMetric, 0.85, 0.1),
-        (AxiomRecallMetric, 0.75, 0.15),
-        (RealityPrecisionMetric, 0.9, 0.05),
-        (RealityRecallMetric, 0.8, 0.12),
+        (0.85, 0.1),
+        (0.75, 0.15),
+        (0.9, 0.05),
+        (0.8, 0.12),
     ],
     ids=[
         "axiom_precision",
@@ -369,70 +341,20 @@ def test_axiom_evaluation_removes_duplicates() -> None:
         "reality_recall",
     ],
 )
-def test_metric_model_creation(
-    metric_class: type, mean: float, std: float
-) -> None:
+def test_metric_model_creation(mean: float, std: float) -> None:
     """Test creating metric models with mean and std."""
-    metric = metric_class(mean=mean, std=std)
+    metric = Metric(mean=mean, std=std)
     assert metric.mean == mean
     assert metric.std == std
 
 
 def test_metric_serialization() -> None:
     """Metrics can be serialized to dict."""
-    metric = AxiomPrecisionMetric(mean=0.85, std=0.1)
+    metric = Metric(mean=0.85, std=0.1)
     data = metric.model_dump()
     assert data == {"mean": 0.85, "std": 0.1}
 
 
-# =============================================================================
-# Tests for calculate_mean_std Function
-# =============================================================================
-
-
-@pytest.mark.parametrize(
-    ("scores", "expected_mean", "expected_std"),
-    [
-        # Empty list
-        ([], 0.0, 0.0),
-        # Single element
-        ([5.0], 5.0, 0.0),
-        # Two elements
-        ([0.0, 1.0], 0.5, 0.5),
-        # Identical values
-        ([0.8, 0.8, 0.8, 0.8], 0.8, 0.0),
-        # Normal distribution of scores
-        ([0.8, 0.9, 0.7, 1.0], 0.85, 0.1118),
-        # All zeros
-        ([0.0, 0.0, 0.0], 0.0, 0.0),
-        # All ones
-        ([1.0, 1.0, 1.0], 1.0, 0.0),
-        # Large spread of values
-        ([0.0, 0.5, 1.0], 0.5, 0.408),
-        # Negative values (edge case)
-        ([-1.0, 0.0, 1.0], 0.0, 0.816),
-    ],
-    ids=[
-        "empty_list",
-        "single_element",
-        "two_elements",
-        "identical_values",
-        "normal_scores",
-        "all_zeros",
-        "all_ones",
-        "large_spread",
-        "negative_values",
-    ],
-)
-def test_calculate_mean_std(
-    scores: list[float], expected_mean: float, expected_std: float
-) -> None:
-    """Test calculate_mean_std utility function with various inputs."""
-    mean, std = calculate_mean_std(scores)
-    assert mean == approx(expected_mean)
-    assert std == approx(expected_std, rel=0.01)
-
-
 # =============================================================================
 # Tests for Statistics Calculation
 # =============================================================================
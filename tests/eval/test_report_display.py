@@ -0,0 +1,187 @@
+"""Tests for the precomputed report display values."""
+
+from typing import Any
+
+import pytest
+
+from eval.report_generation.display import (
+    build_evaluation_display,
+    build_summary,
+    format_percent,
+    format_score,
+    score_class,
+)
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [
+        (1.0, "score-good"),
+        (0.7, "score-good"),
+        (0.69, "score-medium"),
+        (0.4, "score-medium"),
+        (0.39, "score-poor"),
+        (0.0, "score-poor"),
+    ],
+)
+def test_score_class_thresholds(score: float, expected: str) -> None:
+    """Test the score class thresholds used for the badges."""
+    assert score_class(score) == expected
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [
+        (0.0, "0%"),
+        (1.0, "100%"),
+        (0.755, "76%"),
+        # Exact halves round up like JavaScript's toFixed(0)
+        (0.125, "13%"),
+        (0.005, "1%"),
+    ],
+)
+def test_format_percent_matches_to_fixed(score: float, expected: str) -> None:
+    """Test that percentages are formatted like (score * 100).toFixed(0)."""
+    assert format_percent(score) == expected
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [
+        (0.0, "0.00"),
+        (1.0, "1.00"),
+        (0.125, "0.13"),
+        # Stored just below the half, so it rounds down like toFixed(2)
+        (0.975, "0.97"),
+    ],
+)
+def test_format_score_matches_to_fixed(score: float, expected: str) -> None:
+    """Test that scores are formatted like score.toFixed(2)."""
+    assert format_score(score) == expected
+
+
+def test_build_summary() -> None:
+    """Test the summary card values and the six-metric overall score."""
+    means = [0.9, 0.6, 1.0, 0.5, 0.0, 0.4]
+    names = [
+        "accuracy",
+        "topic_coverage",
+        "axiom_precision_metric",
+        "axiom_recall_metric",
+        "reality_precision_metric",
+        "reality_recall_metric",
+    ]
+    data: dict[str, Any] = {
+        "evaluation_outputs": [{}, {}, {}],
+        **{
+            name: {"mean": mean, "std": 0.0}
+            for name, mean in zip(names, means, strict=True)
+        },
+    }
+
+    assert build_summary(data) == {
+        "total_evaluations": "3",
+        "avg_accuracy": "0.90",
+        "avg_coverage": "0.60",
+        "avg_axiom_precision": "1.00",
+        "avg_axiom_recall": "0.50",
+        "avg_reality_precision": "0.00",
+        "avg_reality_recall": "0.40",
+        "overall_score": "0.57",
+        "schema_invalid_samples": "0",
+    }
+
+
+def _evaluation(
+    accuracy: float, coverage: float, expected: str, llm: str
+) -> dict[str, Any]:
+    return {
+        "input": {"expected_answer": expected},
+        "llm_response": llm,
+        "entities": {
+            "user_query_entities": [],
+            "llm_answer_entities": [
+                {
+                    "trigger_variable": "inflation",
+                    "consequence_variable": "interest rates",
+                }
+            ],
+            "expected_answer_entities": [],
+        },
+        "accuracy": {
+            "accuracy_mean": accuracy,
+            "entity_accuracies": [{"score": accuracy}],
+        },
+        "topic_coverage": {"coverage_score": coverage},
+        "axiom_references": {"precision": 1.0, "recall": 0.5},
+        "reality_references": {"precision": 0.0, "recall": 0.333},
+    }
+
+
+def test_build_evaluation_display() -> None:
+    """Test that one display entry is built per evaluation, in order."""
+    data: dict[str, Any] = {
+        "evaluation_outputs": [
+            _evaluation(0.85, 0.5, "a", "b"),
+            _evaluation(0.2, 1.0, "c", "d"),
+        ],
+        "axiom_definitions": None,
+        "reality_definitions": None,
+    }
+
+    display = build_evaluation_display(data, {})
+
+    assert [
+        (
+            entry["accuracy_class"],
+            entry["accuracy_pct"],
+            entry["coverage_class"],
+            entry["coverage_pct"],
+        )
+        for entry in display
+    ] == [
+        ("score-good", "85%", "score-medium", "50%"),
+        ("score-poor", "20%", "score-good", "100%"),
+    ]
+    assert [entry["entity_score_pcts"] for entry in display] == [
+        ["85%"],
+        ["20%"],
+    ]
+    assert display[0]["axiom_references"] == {
+        "precision_class": "score-good",
+        "precision_pct": "100%",
+        "recall_class": "score-medium",
+        "recall_pct": "50%",
+    }
+    assert display[0]["reality_references"]["recall_pct"] == "33%"
+
+
+def test_build_evaluation_display_highlights_common_entities() -> None:
+    """Test that only entities found in both answers are highlighted."""
+    data: dict[str, Any] = {
+        "evaluation_outputs": [
+            _evaluation(
+                1.0,
+                1.0,
+                "Inflation raises interest rates [A-001].",
+                "Inflation matters.",
+            )
+        ],
+        "axiom_definitions": [{"id": "A-001", "description": "Axiom"}],
+        "reality_definitions": None,
+    }
+
+    entry = build_evaluation_display(
+        data, {"inflation": 0, "interest rates": 1}
+    )[0]
+
+    assert entry["highlighted_expected"] == (
+        '<span class="entity-highlight entity-color-0">inflation</span>'
+        " raises interest rates "
+        '<span class="inline-reference inline-axiom-ref" '
+        'data-tooltip="Axiom" tabindex="0">[A-001]</span>.'
+    )
+    assert entry["highlighted_llm"] == (
+        '<span class="entity-highlight entity-color-0">inflation</span>'
+        " matters."
+    )
@@ -1,13 +1,14 @@
 """Tests for the Report class in report_generation module."""
 
+import gzip
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
-from eval.report_generation.report import Report
+from eval.report_generation.report import TEMPLATE_FILES, Report
 
 
 @pytest.fixture
@@ -229,6 +230,16 @@ def test_load_json_data_successfully(
     assert report.evaluation_data == loaded_data
 
 
+def test_evaluation_data_is_loaded_once(temp_json_file: Path) -> None:
+    """Test that the data file is read and validated only once."""
+    report = Report(data_path=str(temp_json_file))
+    loaded_data = report.evaluation_data
+
+    temp_json_file.unlink()
+
+    assert report.load_json_data() is loaded_data
+
+
 def test_load_json_data_empty_file(tmp_path: Path) -> None:
     """Test loading empty JSON file raises ValueError."""
     empty_json_file = tmp_path / "empty.json"
@@ -257,7 +268,7 @@ def test_load_json_data_invalid_json(tmp_path: Path) -> None:
 
     report = Report(data_path=str(invalid_json_file))
 
-    with pytest.raises(json.JSONDecodeError):
+    with pytest.raises(ValueError):
         _ = report.load_json_data()
 
 
@@ -339,6 +350,120 @@ def test_load_json_data_invalid_accuracy_structure(tmp_path: Path) -> None:
         _ = report.load_json_data()
 
 
+def test_load_json_data_quarantines_invalid_sample(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that a single schema-invalid sample is quarantined."""
+    sample_evaluation_data["evaluation_outputs"][1]["accuracy"] = {
+        "wrong_key": 0.0
+    }
+    json_file = tmp_path / "partial.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(sample_evaluation_data, f)
+
+    report = Report(data_path=str(json_file))
+    loaded_data = report.load_json_data()
+
+    assert [
+        output["input"]["id"] for output in loaded_data["evaluation_outputs"]
+    ] == [1]
+    assert len(report.schema_invalid_samples) == 1
+    assert report.schema_invalid_samples[0]["index"] == 1
+    assert report.schema_invalid_samples[0]["errors"]
+
+
+def test_schema_invalid_samples_loads_data_on_first_access(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that quarantined samples don't depend on loading order."""
+    del sample_evaluation_data["evaluation_outputs"][0]["llm_response"]
+    json_file = tmp_path / "partial.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(sample_evaluation_data, f)
+
+    report = Report(data_path=str(json_file))
+
+    invalid_samples = report.schema_invalid_samples
+    assert [sample["index"] for sample in invalid_samples] == [0]
+
+
+def test_load_json_data_ignores_stale_aggregates_of_filtered_run(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that replaced aggregates aren't validated after triage."""
+    del sample_evaluation_data["evaluation_outputs"][1]["llm_response"]
+    sample_evaluation_data["accuracy"] = {"wrong_key": 0.0}
+    json_file = tmp_path / "partial.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(sample_evaluation_data, f)
+
+    loaded_data = Report(data_path=str(json_file)).load_json_data()
+
+    assert loaded_data["accuracy"] == {"mean": 0.95, "std": 0.0}
+
+
+def test_generate_report_writes_schema_invalid_file(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that quarantined samples are written as JSON Lines."""
+    del sample_evaluation_data["evaluation_outputs"][0]["llm_response"]
+    json_file = tmp_path / "partial.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(sample_evaluation_data, f)
+
+    output_dir = tmp_path / "report"
+    Report(
+        data_path=str(json_file), output_dir=str(output_dir)
+    ).generate_report()
+
+    lines = (output_dir / "schema_invalid.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["index"] == 0
+    assert record["sample"]["input"]["id"] == 1
+
+
+def test_generate_report_without_invalid_samples_writes_no_triage_file(
+    temp_json_file: Path, temp_output_dir: Path
+) -> None:
+    """Test that no triage file is left when all samples are valid."""
+    stale_file = temp_output_dir / "schema_invalid.jsonl"
+    _ = stale_file.write_text('{"index": 0}\n')
+
+    Report(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    ).generate_report()
+
+    assert not stale_file.exists()
+
+
+def test_generate_report_summary_excludes_invalid_samples(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that metrics are recomputed over the valid samples only."""
+    del sample_evaluation_data["evaluation_outputs"][1]["llm_response"]
+    json_file = tmp_path / "partial.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(sample_evaluation_data, f)
+
+    output_dir = tmp_path / "report"
+    Report(
+        data_path=str(json_file), output_dir=str(output_dir)
+    ).generate_report()
+
+    with open(output_dir / "evaluation_data.json", encoding="utf-8") as f:
+        written_data = json.load(f)
+
+    # Only the first sample remains: accuracy 0.95, coverage 0.9
+    assert written_data["accuracy"] == {"mean": 0.95, "std": 0.0}
+    assert written_data["topic_coverage"] == {"mean": 0.9, "std": 0.0}
+    summary = written_data["summary"]
+    assert summary["total_evaluations"] == "1"
+    assert summary["avg_accuracy"] == "0.95"
+    assert summary["avg_coverage"] == "0.90"
+    assert summary["schema_invalid_samples"] == "1"
+
+
 def test_generate_report_file_not_found() -> None:
     """Test report generation when input file doesn't exist."""
     report = Report(data_path="/nonexistent/file.json")
@@ -429,31 +554,22 @@ def test_generate_report_permission_error_on_directory_creation(
             report.generate_report()
 
 
-@patch("eval.report_generation.report.shutil.copy2")
-def test_generate_report_copies_template_files(
-    mock_copy: Any,
-    temp_json_file: Path,
-    sample_evaluation_data: dict[str, Any],
+def test_generate_report_writes_minified_template_files(
+    temp_json_file: Path, temp_output_dir: Path
 ) -> None:
-    """Test that template files are copied correctly."""
-    report = Report(data_path=str(temp_json_file))
+    """Test that template files are written without indentation."""
+    Report.create_and_generate(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    )
 
-    # Mock the copy operation to avoid actual file copying
-    # We need to mock json.load to return our sample data
-    mock_file_content = json.dumps(sample_evaluation_data)
-    with patch("eval.report_generation.report.Path.mkdir"):
-        with patch("builtins.open", mock_open(read_data=mock_file_content)):
-            with patch("json.load", return_value=sample_evaluation_data):
-                with patch("json.dump"):
-                    report.generate_report()
+    for filename in TEMPLATE_FILES:
+        lines = (temp_output_dir / filename).read_text().splitlines()
+        assert lines
+        assert all(line and line == line.strip() for line in lines)
 
-    # Verify copy2 was called for CSS, JS, and HTML files
-    assert mock_copy.call_count == 3
-    # assert the parameters of the calls
-    calls = [call.args[0].name for call in mock_copy.call_args_list]
-    assert "styles.css" in calls[0]
-    assert "script.js" in calls[1]
-    assert "index.html" in calls[2]
+    styles = (temp_output_dir / "styles.css").read_text()
+    assert "/*" not in styles
+    assert ".entity-color-0" in styles
 
 
 def test_generate_report_handles_existing_output_directory(
@@ -498,6 +614,52 @@ def test_create_and_generate_loads_data(
     assert (output_path / "evaluation_data.json").exists()
 
 
+def test_generate_report_compress_writes_gzip_copy(
+    temp_json_file: Path, temp_output_dir: Path
+) -> None:
+    """Test that compress=True also writes .gz copies of the report files."""
+    report = Report(
+        data_path=str(temp_json_file),
+        output_dir=str(temp_output_dir),
+        compress=True,
+    )
+    report.generate_report()
+
+    for filename in ("evaluation_data.json", "index.html", "script.js"):
+        plain = (temp_output_dir / filename).read_bytes()
+        compressed = (temp_output_dir / f"{filename}.gz").read_bytes()
+        assert gzip.decompress(compressed) == plain
+
+
+def test_generate_report_without_compress_writes_no_gzip(
+    temp_json_file: Path, temp_output_dir: Path
+) -> None:
+    """Test that the gzip copy is opt-in."""
+    Report.create_and_generate(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    )
+
+    assert not list(temp_output_dir.glob("*.gz"))
+
+
+def test_generate_report_writes_non_ascii_unescaped(
+    tmp_path: Path, sample_evaluation_data: dict[str, Any]
+) -> None:
+    """Test that evaluation_data.json keeps non-ASCII text as UTF-8."""
+    sample_evaluation_data["evaluation_outputs"][0]["llm_response"] = (
+        "Zinssatz für Sparkonten: 1,5 %"
+    )
+    json_file = tmp_path / "unicode.json"
+    _ = json_file.write_text(json.dumps(sample_evaluation_data))
+
+    Report.create_and_generate(data_path=str(json_file))
+
+    written = (tmp_path / "report" / "evaluation_data.json").read_text(
+        encoding="utf-8"
+    )
+    assert "Zinssatz für Sparkonten" in written
+
+
 def test_full_report_generation_workflow(
     temp_json_file: Path, sample_evaluation_data: dict[str, Any]
 ) -> None:
@@ -782,3 +944,79 @@ def test_report_generation_with_reality_only_definitions(
 
     assert written_data["axiom_definitions"] is None
     assert len(written_data["reality_definitions"]) == 1
+
+
+def test_generate_report_writes_evaluation_display(
+    temp_json_file: Path, temp_output_dir: Path
+) -> None:
+    """Test that precomputed display values are written for script.js."""
+    Report.create_and_generate(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    )
+
+    with open(temp_output_dir / "evaluation_data.json", encoding="utf-8") as f:
+        written_data = json.load(f)
+
+    display = written_data["evaluation_display"]
+    assert len(display) == len(written_data["evaluation_outputs"])
+    assert set(display[0]) == {
+        "accuracy_class",
+        "accuracy_pct",
+        "coverage_class",
+        "coverage_pct",
+        "axiom_references",
+        "reality_references",
+        "entity_score_pcts",
+        "highlighted_expected",
+        "highlighted_llm",
+    }
+
+
+def test_generate_report_writes_entity_colors(
+    temp_json_file: Path,
+    temp_output_dir: Path,
+    sample_evaluation_data: dict[str, Any],
+) -> None:
+    """Test that every entity gets a precomputed color index."""
+    Report.create_and_generate(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    )
+
+    with open(temp_output_dir / "evaluation_data.json", encoding="utf-8") as f:
+        written_data = json.load(f)
+
+    entities = {
+        value
+        for evaluation in sample_evaluation_data["evaluation_outputs"]
+        for group in evaluation["entities"].values()
+        for entity in group
+        for value in entity.values()
+        if value
+    }
+    assert set(written_data["entity_colors"]) == entities
+    assert list(written_data["entity_colors"]) == sorted(entities)
+
+
+def test_generate_report_writes_summary(
+    temp_json_file: Path,
+    temp_output_dir: Path,
+    sample_evaluation_data: dict[str, Any],
+) -> None:
+    """Test that the summary statistics are precomputed for script.js."""
+    Report.create_and_generate(
+        data_path=str(temp_json_file), output_dir=str(temp_output_dir)
+    )
+
+    with open(temp_output_dir / "evaluation_data.json", encoding="utf-8") as f:
+        written_data = json.load(f)
+
+    summary = written_data["summary"]
+    assert summary["total_evaluations"] == str(
+        len(sample_evaluation_data["evaluation_outputs"])
+    )
+    # 0.975 is stored just below the half, so it rounds down like toFixed
+    assert summary["avg_accuracy"] == "0.97"
+    assert summary["avg_coverage"] == "0.95"
+    assert summary["avg_axiom_precision"] == "1.00"
+    assert summary["overall_score"] == "0.99"
+    assert summary["schema_invalid_samples"] == "0"
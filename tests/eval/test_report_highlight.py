@@ -0,0 +1,286 @@
+"""Tests for entity and reference highlighting in report answer texts."""
+
+import re
+
+import pytest
+
+from eval.report_generation.highlight import (
+    ENTITY_COLOR_COUNT,
+    assign_entity_colors,
+    convert_line_breaks,
+    escape_html,
+    find_entities_in_text,
+    highlight_entities_in_text,
+    highlight_references_in_text,
+)
+
+
+def _colors(*entities: str) -> dict[str, int]:
+    """Color indices in the given order, like a fresh color map."""
+    return {entity: index for index, entity in enumerate(entities)}
+
+
+def _highlight(
+    text: str,
+    entities: list[str],
+    axiom_definitions: dict[str, str] | None = None,
+    reality_definitions: dict[str, str] | None = None,
+) -> str:
+    return highlight_entities_in_text(
+        text,
+        entities,
+        _colors(*entities),
+        axiom_definitions or {},
+        reality_definitions or {},
+    )
+
+
+def test_escape_html() -> None:
+    """Test that HTML special characters are escaped like script.js."""
+    assert escape_html("<a href=\"x\">'&'</a>") == (
+        "&lt;a href=&quot;x&quot;&gt;&#039;&amp;&#039;&lt;/a&gt;"
+    )
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("a\r\nb\nc\rd", "a<br>b<br>c<br>d"),
+        ("\n\r", "<br><br>"),
+        ("This is **important** text", "This is <b>important</b> text"),
+        ("", ""),
+    ],
+)
+def test_convert_line_breaks(text: str, expected: str) -> None:
+    """Test line break and markdown bold conversion."""
+    assert convert_line_breaks(text) == expected
+
+
+def test_assign_entity_colors_sorted_and_cycled() -> None:
+    """Test that colors follow sorted entity order and cycle the palette."""
+    entities = [f"entity {index:02d}" for index in range(25)]
+    outputs = [
+        {
+            "entities": {
+                "user_query_entities": [
+                    {"trigger_variable": entity, "consequence_variable": ""}
+                    for entity in reversed(entities)
+                ],
+                "llm_answer_entities": [],
+                "expected_answer_entities": [],
+            }
+        }
+    ]
+
+    colors = assign_entity_colors(outputs)
+
+    assert "" not in colors
+    assert colors["entity 00"] == 0
+    assert colors["entity 19"] == ENTITY_COLOR_COUNT - 1
+    assert colors["entity 20"] == 0
+
+
+def test_find_entities_in_text_whole_words() -> None:
+    """Test case-insensitive whole-word matching of each entity."""
+    text = "The central bank interest rate affects MARKETS."
+    entities = ["interest rate", "central bank interest rate", "market"]
+
+    assert find_entities_in_text(text, entities) == [
+        "interest rate",
+        "central bank interest rate",
+    ]
+    assert find_entities_in_text("", entities) == []
+
+
+class TestHighlightReferencesInText:
+    """Tests for highlight_references_in_text."""
+
+    def test_text_without_references_unchanged(self) -> None:
+        text = "This is a text without any references."
+        assert highlight_references_in_text(text, {}, {}) == text
+
+    def test_axiom_reference(self) -> None:
+        result = highlight_references_in_text(
+            "According to [A-001], this is true.",
+            {"A-001": "First axiom description"},
+            {},
+        )
+
+        assert 'class="inline-reference inline-axiom-ref"' in result
+        assert 'data-tooltip="First axiom description"' in result
+        assert "[A-001]" in result
+        assert 'tabindex="0"' in result
+
+    def test_reality_reference(self) -> None:
+        result = highlight_references_in_text(
+            "Based on [R-001], the balance is correct.",
+            {},
+            {"R-001": "First reality description"},
+        )
+
+        assert 'class="inline-reference inline-reality-ref"' in result
+        assert 'data-tooltip="First reality description"' in result
+
+    def test_reference_without_definition_unchanged(self) -> None:
+        text = "Reference [A-999] has no definition."
+        assert highlight_references_in_text(text, {}, {}) == text
+
+    def test_escapes_html_in_descriptions(self) -> None:
+        result = highlight_references_in_text(
+            "Check [A-001] for security.",
+            {"A-001": '<script>alert("XSS")</script>'},
+            {},
+        )
+
+        assert "&lt;script&gt;" in result
+        assert "<script>" not in result
+        assert "&quot;XSS&quot;" in result
+
+    def test_one_to_four_digits_only(self) -> None:
+        axioms = {
+            "A-1": "one",
+            "A-0001": "four",
+            "A-00001": "five",
+        }
+        reality = {"R-12345": "five", "R-01": "two"}
+        text = "[A-1] [A-0001] [A-00001] [R-12345] [R-01]"
+
+        result = highlight_references_in_text(text, axioms, reality)
+
+        assert result.count("data-tooltip") == 3
+        assert "[A-00001]" in result
+        assert "[R-12345]" in result
+        assert 'data-tooltip="five"' not in result
+
+    def test_only_bracketed_references(self) -> None:
+        result = highlight_references_in_text(
+            "A-001 without brackets should not match, but [A-001] should.",
+            {"A-001": "Description"},
+            {},
+        )
+
+        assert result.count("data-tooltip") == 1
+
+
+class TestHighlightEntitiesInText:
+    """Tests for highlight_entities_in_text."""
+
+    def test_no_entities_converts_line_breaks(self) -> None:
+        assert _highlight("Hello\nWorld", []) == "Hello<br>World"
+
+    def test_empty_text(self) -> None:
+        assert _highlight("", ["entity"]) == ""
+
+    def test_multiple_entities_with_colors(self) -> None:
+        result = _highlight(
+            "Political instability affects investor confidence.",
+            ["political instability", "investor confidence"],
+        )
+
+        assert "entity-color-0" in result
+        assert "entity-color-1" in result
+
+    def test_case_insensitive(self) -> None:
+        result = _highlight(
+            "MARKET STABILITY and Market Stability both matter.",
+            ["market stability"],
+        )
+
+        assert result.count("entity-highlight") == 2
+
+    def test_whole_words_only(self) -> None:
+        result = _highlight(
+            "The markets are unstable, but market stability is key.",
+            ["market"],
+        )
+
+        assert result.count("entity-highlight") == 1
+
+    def test_longer_entity_wins_without_nesting(self) -> None:
+        result = _highlight(
+            "The central bank interest rate affects the interest rate.",
+            ["interest rate", "central bank interest rate"],
+        )
+
+        assert (
+            '<span class="entity-highlight entity-color-1">'
+            "central bank interest rate</span>"
+        ) in result
+        assert not re.search(r"<span[^>]*>[^<]*<span", result)
+        assert result.count("entity-highlight") == 2
+
+    def test_entities_and_references(self) -> None:
+        result = _highlight(
+            "According to [A-001], Area R development affects Region A.",
+            ["Area R", "Region A"],
+            {"A-001": "Development axiom"},
+        )
+
+        assert 'data-tooltip="Development axiom"' in result
+        assert "Area R</span>" in result
+        assert "Region A</span>" in result
+
+    def test_entity_matching_reference_id(self) -> None:
+        # Known limitation: an entity equal to a reference ID is highlighted
+        # inside the brackets, so the reference gets no tooltip.
+        result = _highlight(
+            "The code A-001 is different from [A-001].",
+            ["A-001"],
+            {"A-001": "Axiom description"},
+        )
+
+        assert result.count("entity-highlight") == 2
+        assert 'data-tooltip="Axiom description"' not in result
+
+    def test_references_with_no_entities(self) -> None:
+        result = _highlight(
+            "See [A-001] and [R-001] for details.",
+            [],
+            {"A-001": "Axiom one"},
+            {"R-001": "Reality one"},
+        )
+
+        assert 'data-tooltip="Axiom one"' in result
+        assert 'data-tooltip="Reality one"' in result
+
+    def test_no_entities_inside_tooltips(self) -> None:
+        result = _highlight(
+            "Based on [A-001], political instability is a concern.",
+            ["political instability"],
+            {"A-001": "Political instability often disrupts markets"},
+        )
+
+        assert (
+            'data-tooltip="Political instability often disrupts markets"'
+        ) in result
+        assert (
+            '<span class="entity-highlight entity-color-0">'
+            "political instability</span>"
+        ) in result
+        assert not re.search(r'data-tooltip="[^"]*entity-highlight', result)
+
+    def test_line_breaks_and_bold_in_output(self) -> None:
+        result = _highlight(
+            "Line 1\nThis is **important** with [A-001]",
+            ["Line 1"],
+            {"A-001": "Axiom"},
+        )
+
+        assert "<br>" in result
+        assert "\n" not in result
+        assert "<b>important</b>" in result
+
+    def test_escapes_html_in_text(self) -> None:
+        result = _highlight(
+            '<img src=x onerror="alert(1)"> hurts AT&T & amp prices',
+            ["AT&T", "amp"],
+        )
+
+        assert "<img" not in result
+        assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in result
+        assert (
+            '<span class="entity-highlight entity-color-0">AT&amp;T</span>'
+        ) in result
+        # "amp" is only highlighted as a word, not inside "&amp;"
+        assert result.count("entity-highlight") == 2
+        assert " &amp; " in result
@@ -0,0 +1,120 @@
+"""Tests for the run_evaluation pipeline and its command line options."""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from eval import eval as eval_module
+from eval.eval import run_evaluation
+from eval.main import positive_int
+from eval.models import EvaluationSampleInput
+
+SAMPLE_COUNT = 6
+
+
+@pytest.fixture
+def input_data_path(tmp_path: Path) -> Path:
+    """Write an evaluation dataset with SAMPLE_COUNT samples."""
+    samples: list[dict[str, Any]] = [
+        {
+            "id": index,
+            "query": f"Question {index}?",
+            "context": "Context",
+            "expected_answer": "Answer",
+            "reasoning": [],
+            "axioms_used": [],
+            "reality_used": [],
+        }
+        for index in range(SAMPLE_COUNT)
+    ]
+    path = tmp_path / "dataset.json"
+    _ = path.write_text(json.dumps(samples))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def patch_evaluation_steps(monkeypatch: pytest.MonkeyPatch):
+    """Replace LLM evaluation, statistics and report generation."""
+
+    async def fake_evaluate_answer(
+        _sample_input: EvaluationSampleInput, _llm_answer: str
+    ) -> Mock:
+        await asyncio.sleep(0)
+        return Mock()
+
+    result = Mock()
+    result.model_dump_json.return_value = "{}"
+    monkeypatch.setattr(eval_module, "evaluate_answer", fake_evaluate_answer)
+    monkeypatch.setattr(
+        eval_module, "calculate_stats", Mock(return_value=result)
+    )
+    monkeypatch.setattr(eval_module, "Report", Mock())
+
+
+@pytest.mark.parametrize(
+    "max_concurrency, expected_peak",
+    [(1, 1), (2, 2), (None, SAMPLE_COUNT)],
+)
+async def test_run_evaluation_limits_concurrent_questions(
+    input_data_path: Path,
+    tmp_path: Path,
+    max_concurrency: int | None,
+    expected_peak: int,
+):
+    """Test that max_concurrency bounds the in-flight question calls."""
+    active = 0
+    peak = 0
+
+    async def question_answer_fn(*, query: str) -> str:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        # Yield to the event loop so other samples can start meanwhile
+        for _ in range(3):
+            await asyncio.sleep(0)
+        active -= 1
+        return f"Answer to {query}"
+
+    await run_evaluation(
+        question_answer_fn=question_answer_fn,
+        input_data_path=input_data_path,
+        output_data_path=tmp_path / "run",
+        max_concurrency=max_concurrency,
+    )
+
+    assert peak == expected_peak
+    assert len(list((tmp_path / "run").glob("results_*.md"))) == SAMPLE_COUNT
+
+
+async def test_run_evaluation_rejects_non_positive_concurrency(
+    input_data_path: Path, tmp_path: Path
+):
+    """Test that max_concurrency=0 is rejected instead of hanging."""
+
+    async def question_answer_fn(*, query: str) -> str:
+        return f"Answer to {query}"
+
+    with pytest.raises(ValueError, match="positive integer"):
+        await run_evaluation(
+            question_answer_fn=question_answer_fn,
+            input_data_path=input_data_path,
+            output_data_path=tmp_path / "run",
+            max_concurrency=0,
+        )
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_positive_int_rejects_invalid_values(value: str):
+    """Test that --max_concurrency only accepts positive integers."""
+    with pytest.raises(argparse.ArgumentTypeError, match="positive integer"):
+        _ = positive_int(value)
+
+
+def test_positive_int_parses_value():
+    """Test that a positive --max_concurrency value is parsed."""
+    assert positive_int("4") == 4
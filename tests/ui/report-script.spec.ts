@@ -259,6 +259,29 @@ interface ReferenceResults {
   recall: number;
 }
 
+/** Precision/recall badge values, precomputed by display.py */
+interface ReferenceDisplay {
+  precision_class: string;
+  precision_pct: string;
+  recall_class: string;
+  recall_pct: string;
+}
+
+/**
+ * Builds reference badge values for tests (display.py computes these when
+ * the report is generated).
+ */
+function referenceDisplay(precisionPct: string, recallPct: string): ReferenceDisplay {
+  return {
+    precision_class: "score-good",
+    precision_pct: precisionPct,
+    recall_class: "score-good",
+    recall_pct: recallPct,
+  };
+}
+
+const zeroDisplay = referenceDisplay("0%", "0%");
+
 /**
  * Builds a lookup map from definitions array for quick ID-to-description lookup.
  * This is a copy of the function from script.js for testing.
@@ -300,15 +323,6 @@ function renderReferenceTag(
   return `<span class="reference-tag ${tagClass}">${refId}</span>`;
 }
 
-/**
- * Helper to get score class - simplified version for testing
- */
-function getScoreClass(score: number): string {
-  if (score >= 0.8) return "score-high";
-  if (score >= 0.5) return "score-medium";
-  return "score-low";
-}
-
 /**
  * Renders a comparison of expected vs found references.
  * This is a copy of the function from script.js for testing.
@@ -316,6 +330,7 @@ function getScoreClass(score: number): string {
 function renderReferences(
   title: string,
   references: ReferenceResults | null | undefined,
+  referenceDisplay: ReferenceDisplay,
   definitionsMap?: Map<string, string>
 ): string {
   if (!references) {
@@ -323,8 +338,7 @@ function renderReferences(
   }
 
   const defMap = definitionsMap || new Map<string, string>();
-  const precisionClass = getScoreClass(references.precision);
-  const recallClass = getScoreClass(references.recall);
+  const expectedSet = new Set(references.references_expected);
 
   return `
         <div class="references-section">
@@ -349,7 +363,7 @@ function renderReferences(
                           references.references_found.length > 0
                             ? references.references_found
                                 .map((ref) => {
-                                  const isMatch = references.references_expected.includes(ref);
+                                  const isMatch = expectedSet.has(ref);
                                   const tagClass = isMatch
                                     ? "found-match-tag"
                                     : "found-nomatch-tag";
@@ -362,8 +376,8 @@ function renderReferences(
                 </div>
             </div>
             <div class="references-metrics">
-                <span class="score-badge ${precisionClass}">Precision: ${(references.precision * 100).toFixed(0)}%</span>
-                <span class="score-badge ${recallClass}">Recall: ${(references.recall * 100).toFixed(0)}%</span>
+                <span class="score-badge ${referenceDisplay.precision_class}">Precision: ${referenceDisplay.precision_pct}</span>
+                <span class="score-badge ${referenceDisplay.recall_class}">Recall: ${referenceDisplay.recall_pct}</span>
             </div>
         </div>
     `;
@@ -455,11 +469,11 @@ describe("renderReferenceTag", () => {
 
 describe("renderReferences", () => {
   it("should return empty string for null references", () => {
-    expect(renderReferences("Title", null)).toBe("");
+    expect(renderReferences("Title", null, zeroDisplay)).toBe("");
   });
 
   it("should return empty string for undefined references", () => {
-    expect(renderReferences("Title", undefined)).toBe("");
+    expect(renderReferences("Title", undefined, zeroDisplay)).toBe("");
   });
 
   it("should render references without definitions map", () => {
@@ -470,7 +484,7 @@ describe("renderReferences", () => {
       recall: 0.5
     };
 
-    const html = renderReferences("Axiom References", references);
+    const html = renderReferences("Axiom References", references, referenceDisplay("100%", "50%"));
 
     expect(html).toContain("Axiom References");
     expect(html).toContain("A-001");
@@ -491,7 +505,7 @@ describe("renderReferences", () => {
       ["A-002", "Second axiom description"]
     ]);
 
-    const html = renderReferences("Axiom References", references, defMap);
+    const html = renderReferences("Axiom References", references, referenceDisplay("100%", "50%"), defMap);
 
     expect(html).toContain('data-tooltip="First axiom description"');
     expect(html).toContain('data-tooltip="Second axiom description"');
@@ -505,7 +519,7 @@ describe("renderReferences", () => {
       recall: 0
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, zeroDisplay);
 
     expect(html).toContain("None expected");
   });
@@ -518,7 +532,7 @@ describe("renderReferences", () => {
       recall: 0
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, zeroDisplay);
 
     expect(html).toContain("None found");
   });
@@ -531,7 +545,7 @@ describe("renderReferences", () => {
       recall: 1.0
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, referenceDisplay("50%", "100%"));
 
     // A-001 is expected and found - should be found-match-tag
     expect(html).toContain("found-match-tag");
@@ -549,7 +563,7 @@ describe("renderReferences", () => {
     // Only A-001 has a definition
     const defMap = new Map<string, string>([["A-001", "Has description"]]);
 
-    const html = renderReferences("Title", references, defMap);
+    const html = renderReferences("Title", references, zeroDisplay, defMap);
 
     // A-001 should have tooltip
     expect(html).toContain('data-tooltip="Has description"');
@@ -559,529 +573,6 @@ describe("renderReferences", () => {
   });
 });
 
-// ============================================================================
-// Inline Reference Highlighting Tests
-// ============================================================================
-
-/**
- * Highlights axiom and reality references in text by wrapping them with tooltip spans.
- * This is a copy of the function from script.js for testing.
- */
-function highlightReferencesInText(
-  text: string | null | undefined,
-  axiomDefinitionsMap: Map<string, string>,
-  realityDefinitionsMap: Map<string, string>
-): string {
-  if (!text) {
-    return "";
-  }
-
-  // Match patterns like [A-001], [A-002], [R-001], [R-002], etc.
-  // Limit the numeric part to 1–4 digits to avoid matching excessively long IDs
-  const referencePattern = /\[(A-\d{1,4}|R-\d{1,4})\]/g;
-
-  return text.replace(referencePattern, (match, refId: string) => {
-    const isAxiom = refId.startsWith("A-");
-    const definitionsMap = isAxiom ? axiomDefinitionsMap : realityDefinitionsMap;
-    const description = definitionsMap.get(refId);
-
-    if (description) {
-      const escapedDescription = escapeHtml(description);
-      const tagClass = isAxiom ? "inline-axiom-ref" : "inline-reality-ref";
-      return `<span class="inline-reference ${tagClass}" data-tooltip="${escapedDescription}" tabindex="0">[${refId}]</span>`;
-    }
-    // If no description found, return the match unchanged
-    return match;
-  });
-}
-
-describe("highlightReferencesInText", () => {
-  it("should return empty string for null text", () => {
-    const axiomMap = new Map<string, string>();
-    const realityMap = new Map<string, string>();
-    expect(highlightReferencesInText(null, axiomMap, realityMap)).toBe("");
-  });
-
-  it("should return empty string for undefined text", () => {
-    const axiomMap = new Map<string, string>();
-    const realityMap = new Map<string, string>();
-    expect(highlightReferencesInText(undefined, axiomMap, realityMap)).toBe("");
-  });
-
-  it("should return text unchanged when no references found", () => {
-    const axiomMap = new Map<string, string>();
-    const realityMap = new Map<string, string>();
-    const text = "This is a text without any references.";
-    expect(highlightReferencesInText(text, axiomMap, realityMap)).toBe(text);
-  });
-
-  it("should highlight axiom references with tooltips", () => {
-    const axiomMap = new Map<string, string>([["A-001", "First axiom description"]]);
-    const realityMap = new Map<string, string>();
-    const text = "According to [A-001], this is true.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect(result).toContain('class="inline-reference inline-axiom-ref"');
-    expect(result).toContain('data-tooltip="First axiom description"');
-    expect(result).toContain("[A-001]");
-    expect(result).toContain('tabindex="0"');
-  });
-
-  it("should highlight reality references with tooltips", () => {
-    const axiomMap = new Map<string, string>();
-    const realityMap = new Map<string, string>([["R-001", "First reality description"]]);
-    const text = "Based on [R-001], the balance is correct.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect(result).toContain('class="inline-reference inline-reality-ref"');
-    expect(result).toContain('data-tooltip="First reality description"');
-    expect(result).toContain("[R-001]");
-  });
-
-  it("should highlight both axiom and reality references in the same text", () => {
-    const axiomMap = new Map<string, string>([["A-001", "Axiom description"]]);
-    const realityMap = new Map<string, string>([["R-001", "Reality description"]]);
-    const text = "According to [A-001] and [R-001], the answer is correct.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect(result).toContain("inline-axiom-ref");
-    expect(result).toContain("inline-reality-ref");
-    expect(result).toContain('data-tooltip="Axiom description"');
-    expect(result).toContain('data-tooltip="Reality description"');
-  });
-
-  it("should leave references unchanged when no definition exists", () => {
-    const axiomMap = new Map<string, string>();
-    const realityMap = new Map<string, string>();
-    const text = "Reference [A-999] has no definition.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect(result).toBe(text);
-    expect(result).not.toContain("inline-reference");
-    expect(result).not.toContain("data-tooltip");
-  });
-
-  it("should handle multiple references of the same type", () => {
-    const axiomMap = new Map<string, string>([
-      ["A-001", "First axiom"],
-      ["A-002", "Second axiom"]
-    ]);
-    const realityMap = new Map<string, string>();
-    const text = "See [A-001] and [A-002] for details.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    const tooltipCount = (result.match(/data-tooltip/g) || []).length;
-    expect(tooltipCount).toBe(2);
-    expect(result).toContain('data-tooltip="First axiom"');
-    expect(result).toContain('data-tooltip="Second axiom"');
-  });
-
-  it("should escape HTML in descriptions", () => {
-    const axiomMap = new Map<string, string>([["A-001", '<script>alert("XSS")</script>']]);
-    const realityMap = new Map<string, string>();
-    const text = "Check [A-001] for security.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect(result).toContain("&lt;script&gt;");
-    expect(result).not.toContain("<script>");
-    expect(result).toContain("&quot;XSS&quot;");
-  });
-
-  it("should handle references with various number formats", () => {
-    const axiomMap = new Map<string, string>([
-      ["A-1", "Single digit"],
-      ["A-01", "Two digits"],
-      ["A-001", "Three digits"],
-      ["A-0001", "Four digits"]
-    ]);
-    const realityMap = new Map<string, string>();
-    const text = "[A-1] [A-01] [A-001] [A-0001]";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    expect((result.match(/data-tooltip/g) || []).length).toBe(4);
-  });
-
-  it("should NOT match references with 5 or more digits", () => {
-    // The regex pattern limits to 1-4 digits to avoid matching excessively long IDs
-    const axiomMap = new Map<string, string>([
-      ["A-00001", "Five digits - should not match"],
-      ["A-000001", "Six digits - should not match"],
-      ["A-001", "Three digits - should match"]
-    ]);
-    const realityMap = new Map<string, string>([
-      ["R-12345", "Five digits - should not match"],
-      ["R-01", "Two digits - should match"]
-    ]);
-    const text =
-      "[A-00001] has 5 digits, [A-000001] has 6 digits. " +
-      "[R-12345] has 5 digits. Only [A-001] and [R-01] should be highlighted.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    // Only the 1-4 digit references should be highlighted
-    const tooltipCount = (result.match(/data-tooltip/g) || []).length;
-    expect(tooltipCount).toBe(2);
-
-    // Verify the correct ones are highlighted
-    expect(result).toContain('data-tooltip="Three digits - should match"');
-    expect(result).toContain('data-tooltip="Two digits - should match"');
-
-    // Verify 5+ digit references remain as plain text (not wrapped in spans)
-    expect(result).toContain("[A-00001]");
-    expect(result).toContain("[A-000001]");
-    expect(result).toContain("[R-12345]");
-    expect(result).not.toContain('data-tooltip="Five digits');
-    expect(result).not.toContain('data-tooltip="Six digits');
-  });
-
-  it("should only match bracketed references", () => {
-    const axiomMap = new Map<string, string>([["A-001", "Description"]]);
-    const realityMap = new Map<string, string>();
-    const text = "A-001 without brackets should not match, but [A-001] should.";
-
-    const result = highlightReferencesInText(text, axiomMap, realityMap);
-
-    // Only one tooltip should be added (for the bracketed reference)
-    const tooltipCount = (result.match(/data-tooltip/g) || []).length;
-    expect(tooltipCount).toBe(1);
-  });
-});
-
-// ============================================================================
-// Entity Highlighting and Integration Tests
-// ============================================================================
-
-/** @type {Map<string, number>} Maps entity names to their assigned color index for testing */
-const testEntityColorMap = new Map<string, number>();
-let testColorIndex = 0;
-
-/**
- * Gets or assigns a consistent color index for a given entity (test version).
- */
-function getEntityColor(entity: string): number {
-  if (!testEntityColorMap.has(entity)) {
-    testEntityColorMap.set(entity, testColorIndex % 20);
-    testColorIndex++;
-  }
-  return testEntityColorMap.get(entity) ?? 0;
-}
-
-/**
- * Converts line break characters to HTML <br> tags.
- * This is a simplified copy of the function from script.js for testing.
- */
-function convertLineBreaks(text: string | null | undefined): string | null | undefined {
-  if (!text) return text;
-  return text
-    .replace(/\r\n/g, "<br>")
-    .replace(/\n/g, "<br>")
-    .replace(/\r/g, "<br>")
-    .replace(/\*\*(.*?)\*\*/g, "<b>$1</b>");
-}
-
-/**
- * Highlights entities in text by wrapping them with colored spans.
- * Also highlights axiom/reality references with tooltips if definition maps are provided.
- * This is a copy of the function from script.js for testing.
- */
-function highlightEntitiesInText(
-  text: string | null | undefined,
-  entities: string[] | null | undefined,
-  axiomDefinitionsMap?: Map<string, string>,
-  realityDefinitionsMap?: Map<string, string>
-): string | null | undefined {
-  if (!text || !entities || entities.length === 0) {
-    // Still apply reference highlighting even if no entities
-    let result = text;
-    if (axiomDefinitionsMap && realityDefinitionsMap) {
-      result = highlightReferencesInText(result, axiomDefinitionsMap, realityDefinitionsMap);
-    }
-    return convertLineBreaks(result);
-  }
-
-  let highlightedText = text;
-
-  // FIRST: Highlight entities in plain text (before any HTML is added)
-  // Sort entities by length (longest first) to avoid partial matches
-  const sortedEntities = [...entities].sort((a, b) => b.length - a.length);
-
-  sortedEntities.forEach((entity) => {
-    const colorClass = `entity-color-${getEntityColor(entity)}`;
-    // Create a case-insensitive regex that matches whole words
-    const regex = new RegExp(`\\b${entity.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")}\\b`, "gi");
-    highlightedText = highlightedText.replace(
-      regex,
-      `<span class="entity-highlight ${colorClass}">${entity}</span>`
-    );
-  });
-
-  // SECOND: Highlight axiom/reality references AFTER entity highlighting
-  // This ensures we don't match entities inside tooltip data-attributes
-  if (axiomDefinitionsMap && realityDefinitionsMap) {
-    highlightedText = highlightReferencesInText(
-      highlightedText,
-      axiomDefinitionsMap,
-      realityDefinitionsMap
-    );
-  }
-
-  return convertLineBreaks(highlightedText);
-}
-
-describe("highlightEntitiesInText", () => {
-  beforeEach(() => {
-    // Reset color map between tests for predictable results
-    testEntityColorMap.clear();
-    testColorIndex = 0;
-  });
-
-  it("should return text with line breaks converted when no entities", () => {
-    const text = "Hello\nWorld";
-    const result = highlightEntitiesInText(text, []);
-    expect(result).toBe("Hello<br>World");
-  });
-
-  it("should return null for null text", () => {
-    const result = highlightEntitiesInText(null, ["entity"]);
-    expect(result).toBeNull();
-  });
-
-  it("should return undefined for undefined text", () => {
-    const result = highlightEntitiesInText(undefined, ["entity"]);
-    expect(result).toBeUndefined();
-  });
-
-  it("should highlight a single entity", () => {
-    const text = "The market stability is important.";
-    const entities = ["market stability"];
-
-    const result = highlightEntitiesInText(text, entities);
-
-    expect(result).toContain('class="entity-highlight');
-    expect(result).toContain("market stability");
-  });
-
-  it("should highlight multiple entities with different colors", () => {
-    const text = "Political instability affects investor confidence.";
-    const entities = ["political instability", "investor confidence"];
-
-    const result = highlightEntitiesInText(text, entities);
-
-    expect(result).toContain("entity-color-0");
-    expect(result).toContain("entity-color-1");
-  });
-
-  it("should be case-insensitive when matching entities", () => {
-    const text = "MARKET STABILITY and Market Stability both matter.";
-    const entities = ["market stability"];
-
-    const result = highlightEntitiesInText(text, entities);
-
-    // Both occurrences should be highlighted
-    const highlightCount = (result!.match(/entity-highlight/g) || []).length;
-    expect(highlightCount).toBe(2);
-  });
-
-  it("should match whole words only", () => {
-    const text = "The markets are unstable, but market stability is key.";
-    const entities = ["market"];
-
-    const result = highlightEntitiesInText(text, entities);
-
-    // Should only match "market" not "markets"
-    const highlightCount = (result!.match(/entity-highlight/g) || []).length;
-    expect(highlightCount).toBe(1);
-  });
-
-  it("should sort entities by length to avoid partial matches", () => {
-    const text = "The central bank interest rate affects the interest rate.";
-    const entities = ["interest rate", "central bank interest rate"];
-
-    const result = highlightEntitiesInText(text, entities);
-
-    // Longer entity "central bank interest rate" should be processed first
-    // Both entities should be highlighted
-    expect(result).toContain("entity-highlight");
-    expect(result).toContain("interest rate</span>");
-    // The sorting ensures longer matches are attempted first to minimize nesting issues
-    const highlightCount = (result!.match(/entity-highlight/g) || []).length;
-    expect(highlightCount).toBeGreaterThanOrEqual(2);
-  });
-});
-
-describe("highlightEntitiesInText with References - Integration Tests", () => {
-  beforeEach(() => {
-    testEntityColorMap.clear();
-    testColorIndex = 0;
-  });
-
-  it("should highlight both entities and references in the same text", () => {
-    const text = "Political instability [A-001] affects market stability.";
-    const entities = ["political instability", "market stability"];
-    const axiomMap = new Map<string, string>([["A-001", "Political instability disrupts markets"]]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // Check entities are highlighted
-    expect(result).toContain("entity-highlight");
-    expect(result).toContain("political instability");
-    expect(result).toContain("market stability");
-
-    // Check reference is highlighted with tooltip
-    expect(result).toContain("inline-reference");
-    expect(result).toContain("inline-axiom-ref");
-    expect(result).toContain("data-tooltip");
-  });
-
-  it("should not break reference matching when entity names contain letters A or R", () => {
-    const text = "According to [A-001], Area R development affects Region A.";
-    const entities = ["Area R", "Region A"];
-    const axiomMap = new Map<string, string>([["A-001", "Development axiom"]]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // Reference should still be highlighted correctly
-    expect(result).toContain('data-tooltip="Development axiom"');
-    expect(result).toContain("[A-001]");
-
-    // Entities should be highlighted
-    expect(result).toContain("Area R</span>");
-    expect(result).toContain("Region A</span>");
-  });
-
-  it("should not break reference matching when entity names contain numbers", () => {
-    const text = "Product 001 is referenced in [A-001] and [R-002].";
-    const entities = ["Product 001"];
-    const axiomMap = new Map<string, string>([["A-001", "First axiom"]]);
-    const realityMap = new Map<string, string>([["R-002", "Second reality"]]);
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // Both references should be highlighted with tooltips
-    expect(result).toContain('data-tooltip="First axiom"');
-    expect(result).toContain('data-tooltip="Second reality"');
-
-    // Entity should also be highlighted
-    expect(result).toContain("Product 001</span>");
-  });
-
-  it("should highlight entities even if they match reference ID patterns", () => {
-    // KNOWN LIMITATION: When an entity name matches a reference ID (e.g., "A-001"),
-    // the entity highlighting will wrap the ID inside [A-001], breaking the reference
-    // pattern matching. This is acceptable because:
-    // 1. Entity names matching reference IDs (A-XXX, R-XXX) are rare in practice
-    // 2. The unbracketed instance will still be highlighted as an entity
-    const text = "The code A-001 is different from [A-001] which is a reference.";
-    const entities = ["A-001"];
-    const axiomMap = new Map<string, string>([["A-001", "Axiom description"]]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // Both occurrences of A-001 (inside and outside brackets) are highlighted as entities
-    const entityHighlightCount = (result!.match(/entity-highlight/g) || []).length;
-    expect(entityHighlightCount).toBe(2);
-
-    // Note: The reference tooltip will NOT be applied because entity highlighting
-    // breaks the [A-001] pattern into [<span>A-001</span>]
-    // This documents the current behavior as a known limitation
-    expect(result).not.toContain('data-tooltip="Axiom description"');
-  });
-
-  it("should apply reference highlighting even when entities array is empty", () => {
-    const text = "See [A-001] and [R-001] for details.";
-    const entities: string[] = [];
-    const axiomMap = new Map<string, string>([["A-001", "Axiom one"]]);
-    const realityMap = new Map<string, string>([["R-001", "Reality one"]]);
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    expect(result).toContain('data-tooltip="Axiom one"');
-    expect(result).toContain('data-tooltip="Reality one"');
-  });
-
-  it("should not match entities inside reference tooltip attributes", () => {
-    // This is the key integration test - entity highlighting runs first,
-    // so entities should not be found inside the tooltip text that's added later
-    const text = "Based on [A-001], political instability is a concern.";
-    const entities = ["political instability"];
-    const axiomMap = new Map<string, string>([
-      ["A-001", "Political instability often disrupts markets"]
-    ]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // The tooltip should contain the full description without entity spans inside it
-    expect(result).toContain('data-tooltip="Political instability often disrupts markets"');
-
-    // The entity in the main text should be highlighted
-    expect(result).toContain(
-      '<span class="entity-highlight entity-color-0">political instability</span>'
-    );
-
-    // There should be no entity-highlight inside the data-tooltip attribute
-    expect(result).not.toMatch(/data-tooltip="[^"]*entity-highlight[^"]*"/);
-  });
-
-  it("should handle complex text with multiple entities and references", () => {
-    const text =
-      "According to [A-001], political instability disrupts investor confidence. " +
-      "See also [R-001] for current inflation data affecting market stability.";
-    const entities = ["political instability", "investor confidence", "market stability"];
-    const axiomMap = new Map<string, string>([["A-001", "Instability disrupts markets"]]);
-    const realityMap = new Map<string, string>([["R-001", "Current inflation is 2.1%"]]);
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    // All entities should be highlighted
-    expect(result).toContain("political instability</span>");
-    expect(result).toContain("investor confidence</span>");
-    expect(result).toContain("market stability</span>");
-
-    // Both references should have tooltips
-    expect(result).toContain('data-tooltip="Instability disrupts markets"');
-    expect(result).toContain('data-tooltip="Current inflation is 2.1%"');
-
-    // References should have correct classes
-    expect(result).toContain("inline-axiom-ref");
-    expect(result).toContain("inline-reality-ref");
-  });
-
-  it("should convert line breaks in the final output", () => {
-    const text = "Line 1\nLine 2 with [A-001]";
-    const entities = ["Line 1"];
-    const axiomMap = new Map<string, string>([["A-001", "Axiom"]]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    expect(result).toContain("<br>");
-    expect(result).not.toContain("\n");
-  });
-
-  it("should handle markdown bold formatting", () => {
-    const text = "This is **important** text with [A-001].";
-    const entities: string[] = [];
-    const axiomMap = new Map<string, string>([["A-001", "Axiom"]]);
-    const realityMap = new Map<string, string>();
-
-    const result = highlightEntitiesInText(text, entities, axiomMap, realityMap);
-
-    expect(result).toContain("<b>important</b>");
-    expect(result).not.toContain("**important**");
-  });
-});
-
 // ============================================================================
 // Edge Case Tests - Null, Undefined, and Empty Arrays
 // ============================================================================
@@ -1172,7 +663,7 @@ describe("Edge Cases - renderReferences", () => {
       recall: 0
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, zeroDisplay);
 
     expect(html).toContain("None expected");
     expect(html).toContain("None found");
@@ -1186,13 +677,13 @@ describe("Edge Cases - renderReferences", () => {
       recall: 0
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, zeroDisplay);
 
     expect(html).toContain("Precision: 0%");
     expect(html).toContain("Recall: 0%");
   });
 
-  it("should handle decimal precision values correctly", () => {
+  it("should render precomputed precision and recall percentages", () => {
     const references: ReferenceResults = {
       references_expected: ["A-001", "A-002", "A-003"],
       references_found: ["A-001"],
@@ -1200,7 +691,7 @@ describe("Edge Cases - renderReferences", () => {
       recall: 0.333
     };
 
-    const html = renderReferences("Title", references);
+    const html = renderReferences("Title", references, referenceDisplay("100%", "33%"));
 
     expect(html).toContain("Precision: 100%");
     expect(html).toContain("Recall: 33%");